@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import logging
 import tempfile
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, Dict, Optional
 
 from fastapi import Request
@@ -35,6 +35,19 @@ logger = logging.getLogger(__name__)
 _LIVE_CONFIG_DIR_ATTR = "_live_config_dir"
 
 
+def _safe_filename(filename: Optional[str]) -> Optional[str]:
+    """Reduce a client-supplied filename to its final component.
+
+    Upload names come straight from the browser: without this, a name such as
+    ``../../x.yaml`` or ``/etc/x.yaml`` would be written outside the private
+    live-config directory. Windows separators are honoured too.
+    """
+    if not filename:
+        return None
+    name = PurePosixPath(filename.replace("\\", "/")).name
+    return name if name not in ("", ".", "..") else None
+
+
 def adopt_live_config(
     request: Request,
     raw: Dict[str, Any],
@@ -65,7 +78,7 @@ def adopt_live_config(
         the adopted file and stored as ``app.state.preloaded_yaml``.
     filename
         Display filename to adopt (e.g. an uploaded file's original name).
-        Defaults to ``"config.yaml"``.
+        Only its final path component is used. Defaults to ``"config.yaml"``.
     """
     state = request.app.state
     live_dir = getattr(state, _LIVE_CONFIG_DIR_ATTR, None)
@@ -82,9 +95,19 @@ def adopt_live_config(
         setattr(state, _LIVE_CONFIG_DIR_ATTR, live_dir)
 
     path = Path(live_dir) / (
-        filename or getattr(state, "preloaded_filename", None) or "config.yaml"
+        _safe_filename(filename)
+        or getattr(state, "preloaded_filename", None)
+        or "config.yaml"
+    )
+    # Every sync re-adopts the editor's YAML, usually unchanged: skip the
+    # write when the adopted file already holds exactly this text.
+    unchanged = (
+        getattr(state, "preloaded_config_path", None) == str(path)
+        and getattr(state, "preloaded_yaml", None) == yaml_str
+        and path.exists()
     )
-    path.write_text(yaml_str, encoding="utf-8")
+    if not unchanged:
+        path.write_text(yaml_str, encoding="utf-8")
 
     state.preloaded_config = validated
     state.preloaded_raw = raw
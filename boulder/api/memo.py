@@ -0,0 +1,66 @@
+"""Small digest-keyed memo caches for the API routes.
+
+Several routes receive the full config (or another JSON payload) on every
+call and recompute a pure function of it -- Cytoscape elements, the STONE
+YAML export, ... Editing sessions repeat the same payloads a lot, so those
+routes keep a few recent results keyed on a digest of the payload.
+
+The digest is a blake2b hash of the ``sort_keys`` JSON dump: insensitive to
+dict key order (the frontend does not guarantee one), cheap next to the
+conversions it guards, and 16 bytes per key regardless of payload size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Generic, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+def payload_digest(payload: Any) -> bytes:
+    """Return a stable 16-byte digest of a JSON-like ``payload``.
+
+    Values JSON cannot encode natively (numpy scalars, paths, ...) are
+    folded in through ``str``.
+    """
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class DigestLRU(Generic[V]):
+    """Bounded least-recently-used mapping from payload digests to results.
+
+    Parameters
+    ----------
+    maxsize
+        Number of entries kept; the least recently used one is evicted
+        beyond that.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[bytes, V]" = OrderedDict()
+
+    def get(self, key: bytes) -> Optional[V]:
+        """Return the cached value for ``key`` (marking it recent), or None."""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
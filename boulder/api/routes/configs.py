@@ -23,11 +23,21 @@ from ...config import (
     validate_config,
     yaml_to_string_with_comments,
 )
+from ...parser import convert_py_to_yaml
 from ..live_config import adopt_live_config
+from ..memo import DigestLRU, payload_digest
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+#: Recent ``/export`` results keyed on a digest of the posted config --
+#: reopening the YAML editor on an unchanged config skips the STONE
+#: conversion and the (pure-Python, ruamel) dump.
+_export_cache: DigestLRU[str] = DigestLRU(maxsize=8)
+
+#: Read size when spooling an upload to disk.
+_UPLOAD_CHUNK = 1 << 20
+
 
 # ---------------------------------------------------------------------------
 # Request / response schemas
@@ -144,10 +154,17 @@ async def validate_config_endpoint(body: ConfigValidateRequest) -> Dict[str, Any
 
 @router.post("/export")
 async def export_config(body: ConfigExportRequest) -> Dict[str, Any]:
-    """Convert an internal-format config back to STONE YAML string."""
+    """Convert an internal-format config back to STONE YAML string.
+
+    Memoized on a digest of the config (see :data:`_export_cache`).
+    """
     try:
-        stone = convert_to_stone_format(body.config)
-        yaml_str = yaml_to_string_with_comments(stone)
+        key = payload_digest(body.config)
+        yaml_str = _export_cache.get(key)
+        if yaml_str is None:
+            stone = convert_to_stone_format(body.config)
+            yaml_str = yaml_to_string_with_comments(stone)
+            _export_cache.put(key, yaml_str)
         return {"yaml": yaml_str}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -206,22 +223,24 @@ async def upload_config(
     tmp_py = None
     yaml_path = None
     try:
-        contents = await file.read()
-        decoded = contents.decode("utf-8")
-
         if ext == ".py":
-            # Save to temp file, convert via sim2stone, then load YAML
-            from ...parser import convert_py_to_yaml
-
+            # Save to temp file, convert via sim2stone, then load YAML.
+            # The upload is copied to disk as raw bytes in chunks: sim2stone
+            # reads the file itself, so holding (and decoding) a full
+            # in-memory copy here would only double the peak memory.
             # Securely create temp file with suffix to prevent path traversal
+            await file.seek(0)
             with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".py", encoding="utf-8", delete=False
+                mode="wb", suffix=".py", delete=False
             ) as f:
                 tmp_py = f.name
-                f.write(decoded)
+                while chunk := await file.read(_UPLOAD_CHUNK):
+                    f.write(chunk)
 
             try:
-                yaml_path = convert_py_to_yaml(tmp_py)
+                # Validated below with the registered runner, like any YAML
+                # upload -- no need for sim2stone to parse it a first time.
+                yaml_path = convert_py_to_yaml(tmp_py, validate=False)
                 with open(yaml_path, "r", encoding="utf-8") as f:
                     yaml_str = f.read()
             finally:
@@ -231,7 +250,7 @@ async def upload_config(
                 if yaml_path and os.path.exists(yaml_path):
                     os.unlink(yaml_path)
         else:
-            yaml_str = decoded
+            yaml_str = (await file.read()).decode("utf-8")
 
         data = load_yaml_string_with_comments(yaml_str)
         plain = _to_plain_dict(data)
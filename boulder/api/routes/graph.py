@@ -9,6 +9,7 @@ from pydantic import BaseModel
 
 from ...styles import get_cytoscape_stylesheet
 from ...utils import config_to_cyto_elements
+from ..memo import DigestLRU, payload_digest
 
 router = APIRouter()
 
@@ -17,11 +18,31 @@ class GraphElementsRequest(BaseModel):
     config: Dict[str, Any]
 
 
+# Elements memo keyed by a digest of the config. Clients re-post the whole
+# config on every edit, and many edits map back to a config that was
+# already converted (e.g. a property tweak that is reverted).
+_elements_cache: DigestLRU[List[Dict[str, Any]]] = DigestLRU(maxsize=64)
+
+
+def _cached_cyto_elements(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Memoized :func:`config_to_cyto_elements`."""
+    key = payload_digest(config)
+    elements = _elements_cache.get(key)
+    if elements is None:
+        elements = config_to_cyto_elements(config)
+        _elements_cache.put(key, elements)
+    return elements
+
+
 @router.post("/elements")
 async def get_graph_elements(body: GraphElementsRequest) -> List[Dict[str, Any]]:
-    """Convert a config dict to Cytoscape-compatible elements (nodes + edges)."""
+    """Convert a config dict to Cytoscape-compatible elements (nodes + edges).
+
+    Results are memoized on a digest of the config, so re-posting an
+    unchanged config skips the conversion.
+    """
     try:
-        return config_to_cyto_elements(body.config)
+        return _cached_cyto_elements(body.config)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -5,15 +5,39 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
+from ...output_pane_plugins import OutputPaneContext, get_output_pane_registry
+from ..memo import DigestLRU, payload_digest
+from ..sse import sanitize_for_json
+from .simulations import get_completed_simulation_data
+
 router = APIRouter()
 
+#: Recent ``/render`` results keyed on a digest of ``(plugin_id, context)``.
+#: Flipping between elements (or tabs) and back re-posts a context that was
+#: already rendered; plugins build their content from the context alone, so
+#: the earlier result is reused instead of re-rendering (plots, images, ...).
+#: Kept small: rendered content can be a base64 image.
+_render_cache: DigestLRU[Dict[str, Any]] = DigestLRU(maxsize=32)
+
+#: Response for a plugin that does not apply to the posted context. The same
+#: for every plugin, so it is built once; responses are serialized, never
+#: mutated, which makes sharing it safe.
+_UNAVAILABLE: Dict[str, Any] = {
+    "available": False,
+    "message": "Plugin not available for current context",
+}
+
 
 class PluginRenderRequest(BaseModel):
     """Context sent to a plugin for rendering."""
 
     simulation_data: Optional[Dict[str, Any]] = None
+    #: Id of a completed run whose results the server still holds, sent in
+    #: place of ``simulation_data`` so the browser need not re-post them.
+    simulation_id: Optional[str] = None
     selected_element: Optional[Dict[str, Any]] = None
     config: Optional[Dict[str, Any]] = None
     theme: str = "light"
@@ -23,8 +47,6 @@ class PluginRenderRequest(BaseModel):
 async def list_plugins() -> List[Dict[str, Any]]:
     """Return metadata for all registered output-pane plugins."""
     try:
-        from ...output_pane_plugins import get_output_pane_registry
-
         registry = get_output_pane_registry()
         result = []
         for plugin in registry.plugins:
@@ -44,8 +66,6 @@ async def list_plugins() -> List[Dict[str, Any]]:
                 }
             )
         return result
-    except ImportError:
-        return []
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
@@ -58,14 +78,14 @@ async def render_plugin(
     """Render a plugin and return JSON-serialisable data.
 
     The frontend receives structured data (images, tables, HTML snippets)
-    and renders it in a generic ``PluginTab`` component.
+    and renders it in a generic ``PluginTab`` component. Successful renders
+    are memoized on the request context (see :data:`_render_cache`).
+
+    Results of a completed run may be referenced by ``simulation_id``
+    instead of being posted as ``simulation_data``; a 404 tells the client
+    the server no longer holds them and the full results must be sent.
     """
     try:
-        from ...output_pane_plugins import (
-            OutputPaneContext,
-            get_output_pane_registry,
-        )
-
         registry = get_output_pane_registry()
         plugin = registry.get_plugin(plugin_id)
         if plugin is None:
@@ -73,20 +93,37 @@ async def render_plugin(
                 status_code=404, detail=f"Plugin '{plugin_id}' not found"
             )
 
+        key = payload_digest([plugin_id, body.model_dump()])
+        data = _render_cache.get(key)
+        if data is not None:
+            return {"available": True, "data": data}
+
+        simulation_data = body.simulation_data
+        if simulation_data is None and body.simulation_id:
+            simulation_data = get_completed_simulation_data(body.simulation_id)
+            if simulation_data is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Results for simulation '{body.simulation_id}' "
+                    "are no longer available",
+                )
+            # Same payload as the ``complete`` event, encoded the same way.
+            simulation_data = sanitize_for_json(simulation_data)
+
         context = OutputPaneContext(
-            simulation_data=body.simulation_data,
+            simulation_data=simulation_data,
             selected_element=body.selected_element,
             config=body.config,
             theme=body.theme,
         )
 
         if not plugin.is_available(context):
-            return {
-                "available": False,
-                "message": "Plugin not available for current context",
-            }
+            return _UNAVAILABLE
 
-        data = plugin.create_content_data(context)
+        # Off the event loop: plugins draw figures or read files, and a
+        # slow render must not stall other requests or the SSE streams.
+        data = await run_in_threadpool(plugin.create_content_data, context)
+        _render_cache.put(key, data)
         return {"available": True, "data": data}
 
     except HTTPException:
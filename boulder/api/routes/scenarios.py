@@ -18,7 +18,7 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 try:
     import h5py
@@ -30,6 +30,10 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from ... import scenario_editor, scenario_store
+from ...runner import BoulderRunner
+from ...runset import deep_merge, resolve_store_dir
+
 router = APIRouter()
 
 
@@ -41,15 +45,11 @@ def _store_dir(request: Request) -> Optional[Path]:
     sync (and nothing to go stale if a sweep and a single run disagree about
     where the store lives).
     """
-    from ...runset import resolve_store_dir
-
     return resolve_store_dir(_raw_base_config(request) or {}, _config_path(request))
 
 
 def _identity(request: Request) -> str:
     """Return the stamp entries must carry to be readable for this config."""
-    from ... import scenario_store
-
     return scenario_store.config_identity(_config_path(request))
 
 
@@ -68,12 +68,6 @@ def _base_scenarios_snapshot(request: Request) -> Dict[str, Any]:
     return {k: dict(v or {}) for k, v in overlays.items()}
 
 
-def _authored_scenario_ids(overlays: Dict[str, Any]) -> List[str]:
-    from ...scenario_editor import list_scenario_ids
-
-    return list_scenario_ids(overlays)
-
-
 @router.get("")
 async def list_scenarios(request: Request) -> Dict[str, Any]:
     """List the scenarios in the active store (fast — reads attrs only).
@@ -81,12 +75,10 @@ async def list_scenarios(request: Request) -> Dict[str, Any]:
     Also seeds the frontend's scenario-overlay state via ``authored_overlays``
     — see :func:`_base_scenarios_snapshot`.
     """
-    from ... import scenario_store
-
     store_dir = _store_dir(request)
     identity = _identity(request)
     authored_overlays = _base_scenarios_snapshot(request)
-    authored_ids = _authored_scenario_ids(authored_overlays)
+    authored_ids = scenario_editor.list_scenario_ids(authored_overlays)
     entries = scenario_store.list_entries(store_dir, identity)
 
     # `available` says whether the Scenario pane has anything to show. Every
@@ -123,7 +115,6 @@ async def get_scenario(scenario_id: str, request: Request) -> Dict[str, Any]:
     """Return one scenario's composite payload (multi-reactor, reports, Sankey)."""
     if h5py is None:
         raise HTTPException(status_code=503, detail="h5py unavailable")
-    from ... import scenario_store
 
     store_dir = _store_dir(request)
     if store_dir is None:
@@ -204,7 +195,6 @@ def _raw_base_config(request: Request) -> Optional[Dict[str, Any]]:
     cfg_path = _config_path(request)
     if cfg_path is None or not cfg_path.is_file():
         return None
-    from ...runner import BoulderRunner
 
     runner_cls = getattr(request.app.state, "runner_class", None) or BoulderRunner
     return runner_cls.load(str(cfg_path))
@@ -227,9 +217,10 @@ async def get_scenario_source(
     scenario id (its own `scenarioStore.overlays[scenario_id]`) — there is no
     server-side copy to fetch from.
     """
-    from ...scenario_editor import _overlay_yaml_text
-
-    return {"scenario_id": scenario_id, "yaml": _overlay_yaml_text(body.overlay)}
+    return {
+        "scenario_id": scenario_id,
+        "yaml": scenario_editor.overlay_yaml_text(body.overlay),
+    }
 
 
 @router.post("/{scenario_id}/preview")
@@ -248,9 +239,6 @@ async def get_scenario_preview(
     """
     raw = _require_base_raw(request)
 
-    from ...runner import BoulderRunner
-    from ...runset import deep_merge
-
     base_clean = {
         k: v for k, v in raw.items() if k not in ("scenarios", "sweep", "sweeps")
     }
@@ -286,22 +274,21 @@ async def render_full_yaml(
     auto-persists.
     """
     raw = _require_base_raw(request)
-    from ...scenario_editor import render_full_yaml as _render
 
-    return {"scenario_id": scenario_id, "yaml": _render(raw, body.overlay)}
+    return {
+        "scenario_id": scenario_id,
+        "yaml": scenario_editor.render_full_yaml(raw, body.overlay),
+    }
 
 
 @router.post("")
 async def create_scenario(body: CreateScenarioRequest) -> Dict[str, Any]:
     """Create a new scenario overlay — blank, or cloned from an existing one."""
-    from ...scenario_editor import ScenarioEditError
-    from ...scenario_editor import create_scenario as _create
-
     try:
-        new_overlays, yaml_text = _create(
+        new_overlays, yaml_text = scenario_editor.create_scenario(
             body.overlays, body.scenario_id, body.base_scenario_id, body.description
         )
-    except ScenarioEditError as exc:
+    except scenario_editor.ScenarioEditError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {
         "scenario_id": body.scenario_id,
@@ -315,12 +302,11 @@ async def update_scenario(
     scenario_id: str, body: UpdateScenarioRequest
 ) -> Dict[str, Any]:
     """Apply edits to a scenario overlay's YAML text."""
-    from ...scenario_editor import ScenarioEditError
-    from ...scenario_editor import update_scenario as _update
-
     try:
-        new_overlays, yaml_text = _update(body.overlays, scenario_id, body.yaml)
-    except ScenarioEditError as exc:
+        new_overlays, yaml_text = scenario_editor.update_scenario(
+            body.overlays, scenario_id, body.yaml
+        )
+    except scenario_editor.ScenarioEditError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {"scenario_id": scenario_id, "yaml": yaml_text, "overlays": new_overlays}
 
@@ -341,14 +327,12 @@ async def update_scenario_entity(
     caller only needs the id.
     """
     raw = _require_base_raw(request)
-    from ...scenario_editor import ScenarioEditError
-    from ...scenario_editor import update_scenario_entity as _update_entity
 
     try:
-        new_overlays, yaml_text = _update_entity(
+        new_overlays, yaml_text = scenario_editor.update_scenario_entity(
             body.overlays, raw, scenario_id, entity_id, body.properties
         )
-    except ScenarioEditError as exc:
+    except scenario_editor.ScenarioEditError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {
         "scenario_id": scenario_id,
@@ -363,12 +347,11 @@ async def rename_scenario(
     scenario_id: str, body: RenameScenarioRequest
 ) -> Dict[str, Any]:
     """Rename a scenario's id (its overlays-map key)."""
-    from ...scenario_editor import ScenarioEditError
-    from ...scenario_editor import rename_scenario as _rename
-
     try:
-        new_overlays = _rename(body.overlays, scenario_id, body.new_id)
-    except ScenarioEditError as exc:
+        new_overlays = scenario_editor.rename_scenario(
+            body.overlays, scenario_id, body.new_id
+        )
+    except scenario_editor.ScenarioEditError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {"ok": True, "scenario_id": body.new_id, "overlays": new_overlays}
 
@@ -382,8 +365,6 @@ async def clear_scenario_cache(request: Request) -> Dict[str, Any]:
     only ever touched cached *results*, never a scenario definition, so it is
     unaffected by scenario authoring being in-memory.
     """
-    from ... import scenario_store
-
     return {"ok": True, "cleared": scenario_store.clear(_store_dir(request))}
 
 
@@ -397,8 +378,6 @@ async def clear_scenario_entry_cache(
     re-solves this scenario alone instead of the whole run-set. ``cleared``
     reports whether there was actually a cached result to remove.
     """
-    from ... import scenario_store
-
     store_dir = _store_dir(request)
     cleared = (
         scenario_store.delete_entry(store_dir, scenario_id)
@@ -420,13 +399,9 @@ async def delete_scenario(
     response tells the caller whether there was actually a cached result to
     clear.
     """
-    from ... import scenario_store
-    from ...scenario_editor import ScenarioEditError
-    from ...scenario_editor import delete_scenario as _delete
-
     try:
-        new_overlays = _delete(body.overlays, scenario_id)
-    except ScenarioEditError as exc:
+        new_overlays = scenario_editor.delete_scenario(body.overlays, scenario_id)
+    except scenario_editor.ScenarioEditError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     store_dir = _store_dir(request)
     cache_purged = (
@@ -476,7 +451,6 @@ async def focus_scenario(req: FocusRequest, request: Request) -> Dict[str, Any]:
     """Tell every subscribed GUI tab to load scenario ``scenario_id`` (live)."""
     if h5py is None:
         raise HTTPException(status_code=503, detail="h5py unavailable")
-    from ... import scenario_store
 
     store_dir = _store_dir(request)
     if store_dir is None:
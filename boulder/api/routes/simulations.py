@@ -10,16 +10,25 @@ import copy
 import logging
 import time
 import uuid
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
+from ... import scenario_store
 from ...cantera_converter import DualCanteraConverter
 from ...config import TRANSIENT_SOLVER_KINDS, synthesize_default_group
+from ...result_cache import compute_fingerprint, resolve_mechanism_for_fingerprint
+from ...runset import resolve_store_dir
 from ...simulation_worker import SimulationWorker
-from ..sse import sanitize_for_json, simulation_event_stream
+from ..sse import (
+    _serialise_reports,
+    complete_event_payload,
+    encode_json,
+    simulation_event_stream,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +40,11 @@ _simulations: Dict[str, tuple[SimulationWorker, float]] = {}
 
 
 def get_completed_simulation_data(sim_id: str) -> Optional[Dict[str, Any]]:
-    """Return serialised results for a completed simulation, or None."""
+    """Return serialised results for a completed simulation, or None.
+
+    The same payload as the SSE ``complete`` event (see
+    :func:`~boulder.api.sse.complete_event_payload`).
+    """
     entry = _simulations.get(sim_id)
     if entry is None:
         return None
@@ -41,20 +54,7 @@ def get_completed_simulation_data(sim_id: str) -> Optional[Dict[str, Any]]:
     if not progress.is_complete or progress.error_message:
         return None
 
-    from ..sse import _serialise_reports
-
-    return {
-        "times": progress.times,
-        "reactors_series": progress.reactors_series,
-        "reactor_reports": _serialise_reports(progress.reactor_reports),
-        "connection_reports": progress.connection_reports.copy(),
-        "code_str": progress.code_str,
-        "summary": progress.summary,
-        "sankey_links": progress.sankey_links,
-        "sankey_nodes": progress.sankey_nodes,
-        "updated_nodes": progress.updated_nodes,
-        "updated_connections": progress.updated_connections,
-    }
+    return complete_event_payload(progress)
 
 
 # ---------------------------------------------------------------------------
@@ -69,6 +69,15 @@ class StartSimulationRequest(BaseModel):
     time_step: Optional[float] = None
 
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Return ``payload`` pre-encoded, non-finite floats as ``null``.
+
+    Result payloads hold every reactor series; returning a ``Response``
+    skips FastAPI's ``jsonable_encoder`` walk and stdlib re-encode of them.
+    """
+    return Response(content=encode_json(payload), media_type="application/json")
+
+
 def _require_positive(value: float, name: str) -> None:
     """Validate that a numeric simulation parameter is strictly positive."""
     if value <= 0:
@@ -291,7 +300,7 @@ async def stream_simulation(sim_id: str) -> StreamingResponse:
 
 
 @router.get("/{sim_id}/results")
-async def get_simulation_results(sim_id: str, cleanup: bool = False) -> Dict[str, Any]:
+async def get_simulation_results(sim_id: str, cleanup: bool = False) -> Response:
     """Return the full simulation results (non-streaming).
 
     Useful for late-joiners or page refreshes after the simulation
@@ -308,7 +317,7 @@ async def get_simulation_results(sim_id: str, cleanup: bool = False) -> Dict[str
     progress = worker.get_progress()
 
     if not progress.is_complete and not progress.error_message:
-        return sanitize_for_json(
+        return _json_response(
             {
                 "status": "running",
                 "is_complete": False,
@@ -319,8 +328,6 @@ async def get_simulation_results(sim_id: str, cleanup: bool = False) -> Dict[str
             }
         )
 
-    from ..sse import _serialise_reports
-
     result = {
         "status": "complete" if progress.is_complete else "error",
         "is_complete": progress.is_complete,
@@ -342,7 +349,7 @@ async def get_simulation_results(sim_id: str, cleanup: bool = False) -> Dict[str
     if cleanup:
         del _simulations[sim_id]
 
-    return sanitize_for_json(result)
+    return _json_response(result)
 
 
 @router.delete("/{sim_id}")
@@ -369,7 +376,7 @@ async def stop_simulation(sim_id: str) -> Dict[str, Any]:
 async def check_simulation_cache(
     body: StartSimulationRequest,
     request: Request,
-) -> Dict[str, Any]:
+) -> Response:
     """Check whether a cached result exists for the submitted config.
 
     Computes the fingerprint from ``body.config`` (exactly as the simulation
@@ -378,13 +385,6 @@ async def check_simulation_cache(
     Returns ``{"cached": true, "result": {...}, "fingerprint": "...", "meta": {...}}``
     or ``{"cached": false}``.
     """
-    from ... import scenario_store
-    from ...result_cache import (
-        compute_fingerprint,
-        resolve_mechanism_for_fingerprint,
-    )
-    from ...runset import resolve_store_dir
-
     # Normalize exactly like a run would (transient re-runs included).
     config = normalize_config_for_fingerprint(
         body.config, body.simulation_time, body.time_step
@@ -402,7 +402,7 @@ async def check_simulation_cache(
     )
     if store_dir is None:
         logger.info("Result cache disabled (no config path); running a fresh solve.")
-        return {"cached": False}
+        return _json_response({"cached": False})
 
     fingerprint = compute_fingerprint(config, mechanism=mechanism)
     cached = scenario_store.load_matching(
@@ -413,7 +413,7 @@ async def check_simulation_cache(
         logger.info(
             "Cache MISS (fingerprint %s): running a fresh solve.", fingerprint[:12]
         )
-        return {"cached": False}
+        return _json_response({"cached": False})
 
     logger.info(
         "Cache HIT (fingerprint %s): retrieving result from cache, skipping solve.",
@@ -424,7 +424,7 @@ async def check_simulation_cache(
     # both dump the raw worker output) — a cached NaN/Infinity would otherwise
     # reproduce the exact silent-hang bug this endpoint's live-run sibling
     # (get_simulation_results) already guards against.
-    return sanitize_for_json(
+    return _json_response(
         {
             "cached": True,
             "fingerprint": fingerprint,
@@ -435,7 +435,7 @@ async def check_simulation_cache(
 
 
 @router.get("/cached")
-async def get_cached_result(request: Request) -> Dict[str, Any]:
+async def get_cached_result(request: Request) -> Response:
     """Return the cached simulation result for the preloaded configuration.
 
     Returns ``{"cached": true, "result": {...}, "meta": {...}, "fingerprint": "..."}``
@@ -445,10 +445,10 @@ async def get_cached_result(request: Request) -> Dict[str, Any]:
     cached = getattr(request.app.state, "preloaded_result", None)
     fingerprint = getattr(request.app.state, "preloaded_fingerprint", None)
     if cached is None:
-        return {"cached": False}
+        return _json_response({"cached": False})
 
     meta = cached.get("meta", {})
-    return sanitize_for_json(
+    return _json_response(
         {
             "cached": True,
             "fingerprint": fingerprint,
@@ -468,8 +468,6 @@ async def get_cached_artifact(
     Used by contributor plugins to fetch package-specific
     artifacts they wrote during a previous solve.
     """
-    from fastapi.responses import FileResponse
-
     cached = getattr(request.app.state, "preloaded_result", None)
     if cached is None:
         raise HTTPException(status_code=404, detail="No cached result available")
@@ -478,9 +476,7 @@ async def get_cached_artifact(
     if artifacts_dir is None:
         raise HTTPException(status_code=404, detail="No artifacts directory in cache")
 
-    from pathlib import Path as _Path
-
-    artifact_path = _Path(artifacts_dir) / artifact_name
+    artifact_path = Path(artifacts_dir) / artifact_name
     if not artifact_path.is_file():
         raise HTTPException(
             status_code=404,
@@ -488,7 +484,7 @@ async def get_cached_artifact(
         )
     # Safety: ensure the resolved path stays inside the artifacts directory
     try:
-        artifact_path.resolve().relative_to(_Path(artifacts_dir).resolve())
+        artifact_path.resolve().relative_to(Path(artifacts_dir).resolve())
     except ValueError:
         raise HTTPException(status_code=403, detail="Path traversal denied")
 
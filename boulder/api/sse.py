@@ -5,9 +5,78 @@ from __future__ import annotations
 import asyncio
 import json
 import math
-from typing import Any, AsyncGenerator, Dict
+from typing import AbstractSet, Any, AsyncGenerator, Dict
 
-from ..simulation_worker import SimulationWorker
+from ..simulation_worker import SimulationProgress, SimulationWorker
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - environment-dependent
+    # A declared dependency; the stdlib encoder below is only the fallback
+    # for environments installed before it was.
+    orjson = None  # type: ignore[assignment]
+
+#: orjson writes NaN/Infinity as ``null`` itself -- what
+#: :func:`sanitize_for_json` does -- so the recursive copy is skipped.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+#: Per-species arrays in each reactor report that only consumers of the
+#: final result (result cache, plugins, exports) read. Progress events,
+#: resent every poll while a run streams, leave them out.
+_FINAL_ONLY_REPORT_FIELDS = frozenset(
+    {"species_names", "molecular_weights", "mass_fractions"}
+)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize what orjson does not: float subclasses as floats, the rest via ``str``."""
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+def _progress_snapshot(progress: SimulationProgress) -> Dict[str, Any]:
+    """Build a JSON-serialisable snapshot (omit non-serialisable objects)."""
+    return {
+        "is_running": progress.is_running,
+        "is_complete": progress.is_complete,
+        "is_stopping": progress.is_stopping,
+        "error_message": progress.error_message,
+        "stages_done": progress.stages_done,
+        "n_stages": progress.n_stages,
+        "completed_stage_ids": progress.completed_stage_ids,
+        "times": progress.times,
+        "reactors_series": progress.reactors_series,
+        "reactor_reports": _serialise_reports(
+            progress.reactor_reports, exclude=_FINAL_ONLY_REPORT_FIELDS
+        ),
+        "connection_reports": progress.connection_reports.copy(),
+        "total_time": progress.total_time,
+    }
+
+
+def complete_event_payload(progress: SimulationProgress) -> Dict[str, Any]:
+    """Return a completed run's full results, as sent in the ``complete`` event.
+
+    Also what the server hands plugins for a run referenced by id, so a
+    plugin sees the same data whichever way the frontend sent it.
+    """
+    return {
+        **_progress_snapshot(progress),
+        "reactor_reports": _serialise_reports(progress.reactor_reports),
+        "code_str": progress.code_str,
+        "summary": progress.summary,
+        "sankey_links": progress.sankey_links,
+        "sankey_nodes": progress.sankey_nodes,
+        "elapsed_time": progress.get_calculation_time(),
+        # Full nodes + connections after post-build hooks and staged
+        # solver synthesis — single source of truth for the graph.
+        "updated_nodes": progress.updated_nodes,
+        "updated_connections": progress.updated_connections,
+    }
 
 
 async def simulation_event_stream(
@@ -34,21 +103,7 @@ async def simulation_event_stream(
     while True:
         progress = worker.get_progress()
 
-        # Build a JSON-serialisable snapshot (omit non-serialisable objects)
-        snapshot: Dict[str, Any] = {
-            "is_running": progress.is_running,
-            "is_complete": progress.is_complete,
-            "is_stopping": progress.is_stopping,
-            "error_message": progress.error_message,
-            "stages_done": progress.stages_done,
-            "n_stages": progress.n_stages,
-            "completed_stage_ids": progress.completed_stage_ids,
-            "times": progress.times,
-            "reactors_series": progress.reactors_series,
-            "reactor_reports": _serialise_reports(progress.reactor_reports),
-            "connection_reports": progress.connection_reports.copy(),
-            "total_time": progress.total_time,
-        }
+        snapshot = _progress_snapshot(progress)
 
         # A stopped run: is_stopping was set by stop_simulation() and the
         # solve thread has since exited without completing or erroring.
@@ -64,20 +119,7 @@ async def simulation_event_stream(
             return
 
         if progress.is_complete:
-            # Final complete event with full results
-            complete_data: Dict[str, Any] = {
-                **snapshot,
-                "code_str": progress.code_str,
-                "summary": progress.summary,
-                "sankey_links": progress.sankey_links,
-                "sankey_nodes": progress.sankey_nodes,
-                "elapsed_time": progress.get_calculation_time(),
-                # Full nodes + connections after post-build hooks and staged
-                # solver synthesis — single source of truth for the graph.
-                "updated_nodes": progress.updated_nodes,
-                "updated_connections": progress.updated_connections,
-            }
-            yield _sse_event("complete", complete_data)
+            yield _sse_event("complete", complete_event_payload(progress))
             return
 
         # Intermediate progress event
@@ -87,8 +129,25 @@ async def simulation_event_stream(
 
 def _sse_event(event_type: str, data: dict) -> str:
     """Format a single SSE event string."""
-    payload = json.dumps(sanitize_for_json(data), default=str)
-    return f"event: {event_type}\ndata: {payload}\n\n"
+    return f"event: {event_type}\ndata: {encode_json(data)}\n\n"
+
+
+def encode_json(data: Any) -> str:
+    """Encode ``data`` as strict JSON, non-finite floats written as ``null``.
+
+    Progress snapshots and results carry every series accumulated so far, so
+    this runs on payloads that grow with the run: orjson is used when
+    installed, with the stdlib encoder as fallback for anything it refuses
+    (e.g. integers beyond 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, default=_orjson_default, option=_ORJSON_OPTIONS
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(sanitize_for_json(data), default=str)
 
 
 def sanitize_for_json(obj: Any) -> Any:
@@ -114,12 +173,19 @@ def sanitize_for_json(obj: Any) -> Any:
     return obj
 
 
-def _serialise_reports(reports: Dict[str, Any]) -> Dict[str, Any]:
-    """Make reactor_reports JSON-serialisable by dropping non-serialisable fields."""
+def _serialise_reports(
+    reports: Dict[str, Any], exclude: AbstractSet[str] = frozenset()
+) -> Dict[str, Any]:
+    """Make reactor_reports JSON-serialisable by dropping non-serialisable fields.
+
+    Keys in ``exclude`` are left out of every report.
+    """
     safe: Dict[str, Any] = {}
     for rid, report in reports.items():
         entry: Dict[str, Any] = {}
         for k, v in report.items():
+            if k in exclude:
+                continue
             # numpy arrays → lists
             if hasattr(v, "tolist"):
                 entry[k] = v.tolist()
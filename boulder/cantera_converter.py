@@ -191,6 +191,18 @@ class BoulderPlugins:
 # Global cache to ensure plugins are discovered only once
 _PLUGIN_CACHE: Optional[BoulderPlugins] = None
 
+#: Built-in reactor kinds that differ only in their Cantera class: each is
+#: built by :func:`build_reactor_with_energy` with no extra setup, so
+#: :meth:`DualCanteraConverter.create_reactor_from_node` dispatches them
+#: with one dict lookup rather than a branch per kind.
+_ENERGY_REACTOR_CLASSES: Dict[str, Any] = {
+    "IdealGasReactor": ct.IdealGasReactor,
+    "ConstPressureReactor": ct.ConstPressureReactor,
+    "IdealGasConstPressureReactor": ct.IdealGasConstPressureReactor,
+    "IdealGasConstPressureMoleReactor": ct.IdealGasConstPressureMoleReactor,
+    "IdealGasMoleReactor": ct.IdealGasMoleReactor,
+}
+
 
 def _make_valid_python_identifier(name: str) -> str:
     """Convert a name to a valid Python identifier.
@@ -328,6 +340,15 @@ def _select_network_class_for_stage(
     return resolved, net_kw
 
 
+def _species_columns(names: List[str], matrix: Any) -> Dict[str, List[float]]:
+    """Split a ``(n_points, n_species)`` fraction matrix into per-species lists.
+
+    Transposing and calling ``tolist()`` converts the whole matrix in C;
+    indexing it element by element costs a NumPy scalar per sample.
+    """
+    return dict(zip(names, np.asarray(matrix, dtype=float).T.tolist()))
+
+
 def _series_from_stage_states(
     states: Any, scalars: Optional[Dict[str, Any]] = None
 ) -> Optional[Dict[str, Any]]:
@@ -381,19 +402,13 @@ def _series_from_stage_states(
         try:
             x_mat = np.atleast_2d(np.asarray(states.X, dtype=float))
             if x_mat.shape[0] == len(t_col):
-                series["X"] = {
-                    sp: [float(x_mat[i, j]) for i in range(x_mat.shape[0])]
-                    for j, sp in enumerate(names)
-                }
+                series["X"] = _species_columns(names, x_mat)
         except _states_errors as exc:
             logger.debug("Could not read mole fractions from stage states: %s", exc)
         try:
             y_mat = np.atleast_2d(np.asarray(states.Y, dtype=float))
             if y_mat.shape[0] == len(t_col):
-                series["Y"] = {
-                    sp: [float(y_mat[i, j]) for i in range(y_mat.shape[0])]
-                    for j, sp in enumerate(names)
-                }
+                series["Y"] = _species_columns(names, y_mat)
         except _states_errors as exc:
             logger.debug("Could not read mass fractions from stage states: %s", exc)
     try:
@@ -527,8 +542,10 @@ def get_plugins() -> BoulderPlugins:
     """
     global _PLUGIN_CACHE
     if _PLUGIN_CACHE is not None:
-        if is_verbose_mode():
-            logger.info("Using cached plugins")
+        # Hot path (config_to_cyto_elements, every build, ...): let the
+        # logger's level check decide instead of reading the environment on
+        # every call -- the package logger is at DEBUG exactly in verbose mode.
+        logger.debug("Using cached plugins")
         return _PLUGIN_CACHE
 
     if is_verbose_mode():
@@ -681,14 +698,8 @@ class _TrajectoryRecorder:
             series: Dict[str, Any] = {
                 "T": [float(v) for v in d["T"]],
                 "P": [float(v) for v in d["P"]],
-                "X": {
-                    sp: [float(xmat[i, j]) for i in range(xmat.shape[0])]
-                    for j, sp in enumerate(names)
-                },
-                "Y": {
-                    sp: [float(ymat[i, j]) for i in range(ymat.shape[0])]
-                    for j, sp in enumerate(names)
-                },
+                "X": _species_columns(names, xmat),
+                "Y": _species_columns(names, ymat),
                 "t": [float(v) for v in d["t"]],
             }
             if d.get("axis") == "distance":
@@ -1137,45 +1148,9 @@ class DualCanteraConverter:
             reactor = self.plugins.reactor_builders[typ](self, node)
             reactor.name = rid
             validate_energy_on_built_reactor(reactor, props, typ)
-        elif typ == "IdealGasReactor":
-            reactor = build_reactor_with_energy(
-                ct.IdealGasReactor,
-                gas_for_node,
-                props=props,
-                clone=clone,
-                type_name=typ,
-            )
-            reactor.name = rid
-        elif typ == "ConstPressureReactor":
-            reactor = build_reactor_with_energy(
-                ct.ConstPressureReactor,
-                gas_for_node,
-                props=props,
-                clone=clone,
-                type_name=typ,
-            )
-            reactor.name = rid
-        elif typ == "IdealGasConstPressureReactor":
-            reactor = build_reactor_with_energy(
-                ct.IdealGasConstPressureReactor,
-                gas_for_node,
-                props=props,
-                clone=clone,
-                type_name=typ,
-            )
-            reactor.name = rid
-        elif typ == "IdealGasConstPressureMoleReactor":
+        elif typ in _ENERGY_REACTOR_CLASSES:
             reactor = build_reactor_with_energy(
-                ct.IdealGasConstPressureMoleReactor,
-                gas_for_node,
-                props=props,
-                clone=clone,
-                type_name=typ,
-            )
-            reactor.name = rid
-        elif typ == "IdealGasMoleReactor":
-            reactor = build_reactor_with_energy(
-                ct.IdealGasMoleReactor,  # type: ignore[arg-type]
+                _ENERGY_REACTOR_CLASSES[typ],
                 gas_for_node,
                 props=props,
                 clone=clone,
@@ -2728,10 +2703,7 @@ class DualCanteraConverter:
             results["sankey_links"] = sankey_links_for_api(links, plugins=self.plugins)
             results["sankey_nodes"] = nodes
         except Exception as e:
-            logger.error(f"Error generating Sankey diagram: {e}")
-            import traceback
-
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(f"Error generating Sankey diagram: {e}")
             results["sankey_links"] = None
             results["sankey_nodes"] = None
             # Sankey is optional post-processing; do not fail an otherwise successful solve.
@@ -2817,14 +2789,8 @@ class DualCanteraConverter:
                 rid: {
                     "T": [float(r.phase.T)],
                     "P": [float(r.phase.P)],
-                    "X": {
-                        s: [float(r.phase.X[r.phase.species_index(s)])]
-                        for s in r.phase.species_names
-                    },
-                    "Y": {
-                        s: [float(r.phase.Y[r.phase.species_index(s)])]
-                        for s in r.phase.species_names
-                    },
+                    "X": _species_columns(r.phase.species_names, r.phase.X[np.newaxis]),
+                    "Y": _species_columns(r.phase.species_names, r.phase.Y[np.newaxis]),
                 }
                 for rid, r in self.reactors.items()
                 if not isinstance(r, ct.Reservoir)
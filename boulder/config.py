@@ -16,6 +16,13 @@ from typing import Any, Dict, List, Optional, Tuple
 import yaml
 from ruamel.yaml import YAML
 
+try:
+    # libyaml-backed loader: same safe semantics, several times faster on
+    # large STONE files. Not every PyYAML build ships it.
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlSafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Global variable for temperature scale coloring
@@ -211,6 +218,17 @@ _CONST_PRESSURE_KINDS: frozenset = frozenset(
     }
 )
 
+# Boundary node kinds (no reactor state of their own). Always pressure-bearing
+# for the pressure-propagation pass, and exempt from reactor state placement
+# rules.
+_BOUNDARY_KINDS: frozenset = frozenset({"Reservoir", "OutletSink"})
+
+# Flow-device connection kinds that carry process pressure between nodes
+# (a Wall couples two nodes thermally/mechanically but carries no flow).
+_PRESSURE_CARRYING_FLOW_KINDS: frozenset = frozenset(
+    {"MassFlowController", "PressureController", "Valve"}
+)
+
 
 def _is_const_pressure_kind(kind: str) -> bool:
     """Return True when *kind* operates at constant pressure.
@@ -393,7 +411,7 @@ def _validate_node_state_placement(
     stage_id: str,
 ) -> None:
     """Raise ValueError when a reactor has forbidden top-level state fields."""
-    if kind in ("Reservoir", "OutletSink"):
+    if kind in _BOUNDARY_KINDS:
         return
 
     if "inlet" in props or "outlet" in props:
@@ -1058,7 +1076,7 @@ def load_config_file(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML file with 🪨 STONE standard."""
     _assert_stone_yaml_extension(config_path)
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlSafeLoader)
 
 
 def load_config_file_with_comments(config_path: str):
@@ -1733,17 +1751,12 @@ def propagate_terminal_pressure_defaults(config: Dict[str, Any]) -> None:
     if not nodes:
         return
 
-    # Flow-device connection types that carry process pressure.
-    _FLOW_TYPES = frozenset({"MassFlowController", "PressureController", "Valve"})
-
     # Node types that should receive a defaulted pressure when missing.
     # Reservoirs and sinks are always pressure-bearing; any const-pressure
     # reactor kind (detected by the ``"ConstPressure"`` naming convention) is
     # also pressure-bearing.
-    _PRESSURE_BEARING_SINKS = frozenset({"Reservoir", "OutletSink"})
-
     def _is_pressure_bearing(kind: str) -> bool:
-        return kind in _PRESSURE_BEARING_SINKS or _is_const_pressure_kind(kind)
+        return kind in _BOUNDARY_KINDS or _is_const_pressure_kind(kind)
 
     node_ids = [n["id"] for n in nodes]
     id_to_node = {n["id"]: n for n in nodes}
@@ -1752,7 +1765,7 @@ def propagate_terminal_pressure_defaults(config: Dict[str, Any]) -> None:
     adjacency: Dict[str, List[str]] = {nid: [] for nid in node_ids}
     for conn in connections:
         ctype = conn.get("type", "MassFlowController")
-        if ctype not in _FLOW_TYPES:
+        if ctype not in _PRESSURE_CARRYING_FLOW_KINDS:
             continue
         src = conn.get("source")
         tgt = conn.get("target")
@@ -2543,7 +2556,7 @@ def save_config_to_file_with_comments(
                 f.write(yaml_str)
             return
         except Exception as e:
-            print(f"Warning: Could not preserve comments, using standard format: {e}")
+            logger.warning("Could not preserve comments, using standard format: %s", e)
 
     stone_config = convert_to_stone_format(config)
     yaml_str = yaml_to_string_with_comments(stone_config)
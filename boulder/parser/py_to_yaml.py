@@ -1,16 +1,24 @@
 """Python to YAML conversion utilities using sim2stone."""
 
 import os
+import re
 import tempfile
 from typing import Optional
 
+import yaml
 
-def _run_sim2stone_conversion(py_path: str, verbose: bool = False) -> str:
+from ..config import YamlSafeLoader
+
+
+def _run_sim2stone_conversion(
+    py_path: str, verbose: bool = False, validate: bool = True
+) -> str:
     """Run sim2stone conversion on a Python file.
 
     Args:
         py_path: Path to the Python file
         verbose: Enable verbose output
+        validate: Let sim2stone re-load and validate the written YAML
 
     Returns
     -------
@@ -30,6 +38,8 @@ def _run_sim2stone_conversion(py_path: str, verbose: bool = False) -> str:
     args = [py_path, "-o", yaml_path]
     if verbose:
         args.append("--verbose")
+    if not validate:
+        args.append("--no-validate")
 
     # Run sim2stone conversion
     exit_code = sim2stone_main(args)
@@ -54,6 +64,10 @@ def _run_sim2stone_conversion(py_path: str, verbose: bool = False) -> str:
 def _generate_unique_yaml_path(original_yaml_path: str) -> str:
     """Generate a unique YAML path when a conflict exists.
 
+    The directory is listed once and the next suffix is one past the largest
+    existing ``_converted[_N]`` suffix, instead of probing the filesystem
+    candidate by candidate.
+
     Args:
         original_yaml_path: The original YAML path that would conflict
 
@@ -62,15 +76,22 @@ def _generate_unique_yaml_path(original_yaml_path: str) -> str:
         A unique path with a suffix like _converted, _converted_2, etc.
     """
     base, ext = os.path.splitext(original_yaml_path)
-    counter = 1
+    directory, stem = os.path.split(base)
+    pattern = re.compile(rf"{re.escape(stem)}_converted(?:_(\d+))?{re.escape(ext)}$")
+    try:
+        names = os.listdir(directory or ".")
+    except OSError:
+        names = []
 
-    # Try _converted first
-    new_path = f"{base}_converted{ext}"
-    while os.path.exists(new_path):
-        counter += 1
-        new_path = f"{base}_converted_{counter}{ext}"
+    max_n = 0
+    for name in names:
+        m = pattern.match(name)
+        if m:
+            max_n = max(max_n, int(m.group(1)) if m.group(1) else 1)
 
-    return new_path
+    if max_n == 0:
+        return f"{base}_converted{ext}"
+    return f"{base}_converted_{max_n + 1}{ext}"
 
 
 def _yaml_files_are_different(yaml_path1: str, yaml_path2: str) -> bool:
@@ -84,12 +105,10 @@ def _yaml_files_are_different(yaml_path1: str, yaml_path2: str) -> bool:
     -------
         True if files are different, False if they are the same
     """
-    import yaml
-
     with open(yaml_path1, "r", encoding="utf-8") as f1:
-        content1 = yaml.safe_load(f1)
+        content1 = yaml.load(f1, Loader=YamlSafeLoader)
     with open(yaml_path2, "r", encoding="utf-8") as f2:
-        content2 = yaml.safe_load(f2)
+        content2 = yaml.load(f2, Loader=YamlSafeLoader)
 
     return content1 != content2
 
@@ -190,7 +209,10 @@ def _handle_yaml_conflicts(
 
 
 def convert_py_to_yaml(
-    py_input, output_path: Optional[str] = None, verbose: bool = False
+    py_input,
+    output_path: Optional[str] = None,
+    verbose: bool = False,
+    validate: bool = True,
 ) -> str:
     """Convert Python file or content to YAML using sim2stone.
 
@@ -204,6 +226,9 @@ def convert_py_to_yaml(
         py_input: Either a file path (str) or Python code content (str)
         output_path: Path where to save the YAML file (optional for file input)
         verbose: Enable verbose output
+        validate: Validate the generated YAML during conversion. Callers that
+            load and validate the result themselves pass False to skip the
+            redundant parse.
 
     Returns
     -------
@@ -241,7 +266,7 @@ def convert_py_to_yaml(
 
     try:
         # Run the conversion
-        yaml_path = _run_sim2stone_conversion(py_path, verbose)
+        yaml_path = _run_sim2stone_conversion(py_path, verbose, validate=validate)
 
         # Handle conflicts and temporary files
         final_yaml_path = _handle_yaml_conflicts(
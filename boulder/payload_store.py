@@ -35,7 +35,8 @@ off-shape arrays such as ``fbs_convergence`` which is per-FBS-iteration, not
 per-state) ride in the per-reactor ``meta`` of ``reactors_index`` and are merged
 back on load, so the original series is reproduced exactly.
 
-Depends only on ``cantera`` + ``h5py`` + numpy + stdlib.
+Depends only on ``cantera`` + ``h5py`` + numpy + stdlib, plus ``orjson`` to
+speed up reading ``payload_json``.
 """
 
 from __future__ import annotations
@@ -61,6 +62,29 @@ else:
     _H5PY_IMPORT_ERROR = None
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - environment-dependent
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads_payload_json(raw: Any) -> Any:
+    """Parse the ``payload_json`` blob (``bytes`` or ``str``), with orjson when it can.
+
+    ``json.dumps`` writes non-finite floats as ``NaN``/``Infinity``, which
+    orjson rejects. A blob containing either token goes straight to the
+    stdlib parser instead of paying for a failed orjson parse first; a string
+    value that merely contains one only forgoes the fast path.
+    """
+    if orjson is not None:
+        tokens = ("NaN", "Infinity") if isinstance(raw, str) else (b"NaN", b"Infinity")
+        if not any(token in raw for token in tokens):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(raw)
+
 
 def _require_h5py() -> None:
     """Raise a clear error when the HDF5 backend is unavailable."""
@@ -393,9 +417,8 @@ def read_payload(
             or _to_str(node.attrs.get("mechanism", ""))
             or _to_str(handle.attrs.get("mechanism", ""))
         )
-    if isinstance(raw, bytes):
-        raw = raw.decode("utf-8")
-    gui = json.loads(raw)
+    # h5py hands the blob back as UTF-8 bytes; both parsers take bytes directly.
+    gui = _loads_payload_json(raw)
 
     index = gui.pop("reactors_index", None)
     if index is None:
@@ -53,7 +53,8 @@ def _validate_id(scenario_id: str) -> None:
         )
 
 
-def _overlay_yaml_text(overlay: Any) -> str:
+def overlay_yaml_text(overlay: Any) -> str:
+    """Return one scenario overlay as YAML text (``{}`` for a missing overlay)."""
     return yaml_to_string_with_comments(overlay if overlay is not None else {})
 
 
@@ -108,14 +109,14 @@ def create_scenario(
         metadata["scenario_name"] = description
 
     new_overlays = {**overlays, scenario_id: overlay}
-    return new_overlays, _overlay_yaml_text(overlay)
+    return new_overlays, overlay_yaml_text(overlay)
 
 
 def read_scenario(overlays: Dict[str, dict], scenario_id: str) -> str:
     """Return one scenario overlay's YAML text (for the scoped editor)."""
     if scenario_id not in overlays:
         raise ScenarioEditError(f"Unknown scenario {scenario_id!r}")
-    return _overlay_yaml_text(overlays[scenario_id])
+    return overlay_yaml_text(overlays[scenario_id])
 
 
 def update_scenario(
@@ -132,7 +133,7 @@ def update_scenario(
         raise ScenarioEditError("A scenario overlay must be a YAML mapping")
     new_overlay = parsed if parsed is not None else {}
     new_overlays = {**overlays, scenario_id: new_overlay}
-    return new_overlays, _overlay_yaml_text(new_overlay)
+    return new_overlays, overlay_yaml_text(new_overlay)
 
 
 def _entity_location(raw: dict, entity_id: str) -> Optional[Tuple[str, Optional[str]]]:
@@ -194,7 +195,7 @@ def update_scenario_entity(
     if scenario_id not in overlays:
         raise ScenarioEditError(f"Unknown scenario {scenario_id!r}")
     if not properties:
-        return overlays, _overlay_yaml_text(overlays[scenario_id])
+        return overlays, overlay_yaml_text(overlays[scenario_id])
 
     located = _entity_location(base_raw, entity_id)
     if located is None:
@@ -232,7 +233,7 @@ def update_scenario_entity(
             entry[key] = value
 
     new_overlays = {**overlays, scenario_id: overlay}
-    return new_overlays, _overlay_yaml_text(overlay)
+    return new_overlays, overlay_yaml_text(overlay)
 
 
 def rename_scenario(
@@ -66,6 +66,14 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Exclude comment parsing from Python source code",
     )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help=(
+            "Skip re-loading and validating the written YAML. For callers that "
+            "parse and validate the file themselves right after conversion."
+        ),
+    )
     parser.add_argument(
         "--interactive",
         action="store_true",
@@ -214,15 +222,16 @@ def main(argv: Optional[list[str]] = None) -> int:
     # Always print the created file path so callers can capture/chain it
     print(f"🪨 STONE file created in {output_path}")
 
-    # Validate the generated YAML (fail fast on errors)
-    from .config import load_config_file, normalize_config, validate_config
+    if not args.no_validate:
+        # Validate the generated YAML (fail fast on errors)
+        from .config import load_config_file, normalize_config, validate_config
 
-    cfg = load_config_file(output_path)
-    normalized = normalize_config(cfg)
-    validated = validate_config(normalized)
-    num_nodes = len(validated.get("nodes", []))
-    num_conns = len(validated.get("connections", []))
-    print(f"Validated STONE YAML ({num_nodes} nodes, {num_conns} connections)")
+        cfg = load_config_file(output_path)
+        normalized = normalize_config(cfg)
+        validated = validate_config(normalized)
+        num_nodes = len(validated.get("nodes", []))
+        num_conns = len(validated.get("connections", []))
+        print(f"Validated STONE YAML ({num_nodes} nodes, {num_conns} connections)")
 
     if args.verbose:
         print(f"[sim2stone] Done: {output_path}")
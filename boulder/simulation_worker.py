@@ -12,6 +12,11 @@ from .verbose_utils import get_verbose_logger
 
 logger = get_verbose_logger(__name__)
 
+#: Minimum seconds between thermo-report refreshes while a run streams.
+#: Matches the SSE poll interval: progress fires on every integration step,
+#: and a report replaced before any client polls it is wasted work.
+_REPORT_REFRESH_INTERVAL = 0.5
+
 
 def _copy_reactors_series(
     series: Dict[str, Dict[str, Any]],
@@ -55,6 +60,10 @@ def generate_reactor_reports(converter: Any, results: Dict[str, Any]) -> Dict[st
         # Generate reports for each reactor
         for reactor_id, reactor in converter.reactors.items():
             phase = reactor.phase
+            # Each ThermoPhase property access builds a fresh list/array, so
+            # read them once per reactor (``phase.X[i]`` per species was
+            # quadratic in the species count).
+            species_names = phase.species_names
             if isinstance(reactor, ct.Reservoir):
                 # Handle Reservoirs - they maintain fixed thermodynamic conditions
                 current_T = phase.T
@@ -64,10 +73,8 @@ def generate_reactor_reports(converter: Any, results: Dict[str, Any]) -> Dict[st
                 reactor_reports[reactor_id] = {
                     "T": current_T,
                     "P": current_P,
-                    "X": {
-                        name: phase.X[i] for i, name in enumerate(phase.species_names)
-                    },
-                    "species_names": phase.species_names,
+                    "X": dict(zip(species_names, phase.X.tolist())),
+                    "species_names": species_names,
                     "molecular_weights": phase.molecular_weights.tolist(),
                     "mass_fractions": phase.Y.tolist(),
                     # Generate formatted reports for UI display
@@ -93,7 +100,7 @@ def generate_reactor_reports(converter: Any, results: Dict[str, Any]) -> Dict[st
                         "T": final_T,
                         "P": final_P,
                         "X": final_X,
-                        "species_names": phase.species_names,
+                        "species_names": species_names,
                         "molecular_weights": phase.molecular_weights.tolist(),
                         "mass_fractions": phase.Y.tolist(),
                         # Generate formatted reports for UI display
@@ -132,11 +139,8 @@ def generate_connection_reports(converter: Any) -> Dict[str, Any]:
             thermo = upstream.phase
             T = float(thermo.T)
             P = float(thermo.P)
-            # Cantera molecular_weights in kg/kmol; X is mole fractions
-            M_kg_kmol = sum(
-                float(thermo.X[i]) * float(thermo.molecular_weights[i])
-                for i in range(thermo.n_species)
-            )
+            # Mole-fraction-weighted molecular weight, in kg/kmol
+            M_kg_kmol = float(thermo.mean_molecular_weight)
             M_kg_mol = M_kg_kmol / 1000.0
             rho = (P * M_kg_mol) / (R_GAS * T)
             rho_normal = (P_NORMAL_PA * M_kg_mol) / (R_GAS * T_NORMAL_K)
@@ -429,6 +433,7 @@ class SimulationWorker:
 
             # Track last logged % for verbose throttle (log at 0, 25, 50, 75, 100)
             last_logged_pct: List[float] = [-1]
+            last_report_time: List[float] = [float("-inf")]
 
             # Define progress callback for streaming updates
             def progress_callback(
@@ -438,6 +443,20 @@ class SimulationWorker:
                 if self._stop_event.is_set():
                     return  # Don't update if stopping
 
+                # Stream updated thermo reports so Thermo tab reflects latest
+                # state -- throttled, and built before taking the lock so SSE
+                # polls are not blocked on report formatting.
+                reports: Optional[Dict[str, Any]] = None
+                now = time.monotonic()
+                if now - last_report_time[0] >= _REPORT_REFRESH_INTERVAL:
+                    last_report_time[0] = now
+                    try:
+                        reports = generate_reactor_reports(converter, progress_data)
+                    except Exception as stream_err:
+                        logger.debug(
+                            f"Streaming reactor report generation failed: {stream_err}"
+                        )
+
                 with self._lock:
                     self.progress.times = progress_data["time"]
                     self.progress.reactors_series = progress_data["reactors"]
@@ -457,19 +476,8 @@ class SimulationWorker:
                             f"Simulation progress: {progress_pct:.1f}% "
                             f"(t={current_time:.1f}s / {total_time:.1f}s)"
                         )
-                    # Stream updated thermo reports so Thermo tab reflects latest state
-                    try:
-                        interim_results = {
-                            "time": self.progress.times,
-                            "reactors": self.progress.reactors_series,
-                        }
-                        self.progress.reactor_reports = generate_reactor_reports(
-                            converter, interim_results
-                        )
-                    except Exception as stream_err:
-                        logger.debug(
-                            f"Streaming reactor report generation failed: {stream_err}"
-                        )
+                    if reports is not None:
+                        self.progress.reactor_reports = reports
 
             # Register network on progress now that build is complete
             with self._lock:
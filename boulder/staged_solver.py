@@ -1131,11 +1131,18 @@ def _sync_streams_into_config(
     config["connections"] = [
         c for c in (config.get("connections") or []) if c["id"] not in replaced_conn_ids
     ]
-    existing_node_ids = {n["id"] for n in (config.get("nodes") or [])}
-    existing_conn_ids = {c["id"] for c in config["connections"]}
-    config.setdefault("nodes", [])
+    # id -> entry maps (first occurrence wins, as the scans they replace did):
+    # membership tests and in-place updates below are dict lookups, not
+    # rescans of the whole node/connection lists per stream point.
+    existing_nodes: Dict[str, Dict[str, Any]] = {}
+    for n in config.setdefault("nodes", []):
+        existing_nodes.setdefault(n["id"], n)
+    existing_conns: Dict[str, Dict[str, Any]] = {}
+    for c in config["connections"]:
+        existing_conns.setdefault(c["id"], c)
     for nd in stream_node_dicts.values():
-        if nd["id"] not in existing_node_ids:
+        existing_nd = existing_nodes.get(nd["id"])
+        if existing_nd is None:
             # Merge any derived thermo stored on the node dict back into properties
             # so the frontend PropertiesPanel sees all stream data in one payload.
             nd_copy = dict(nd)
@@ -1143,12 +1150,7 @@ def _sync_streams_into_config(
             config["nodes"].append(nd_copy)
         else:
             # Update existing node's properties with derived thermo (T, P, Y, mdot, …)
-            for existing_nd in config["nodes"]:
-                if existing_nd["id"] == nd["id"]:
-                    existing_nd.setdefault("properties", {}).update(
-                        nd.get("properties") or {}
-                    )
-                    break
+            existing_nd.setdefault("properties", {}).update(nd.get("properties") or {})
 
     # Add one display-only "StreamConnector" edge per source node so the graph
     # shows a continuous chain:  source_reactor → stream_point → target_reactor.
@@ -1160,36 +1162,33 @@ def _sync_streams_into_config(
         connector_id = f"{source_id}_to_{stream_id}"
         if (
             source_id not in seen_connector_sources
-            and connector_id not in existing_conn_ids
+            and connector_id not in existing_conns
         ):
             seen_connector_sources.add(source_id)
-            config["connections"].append(
-                {
-                    "id": connector_id,
-                    "type": "StreamConnector",
-                    "source": source_id,
-                    "target": stream_id,
-                    "properties": {},
-                    "metadata": {"stream_point": True, "side": "outlet_connector"},
-                }
-            )
-            existing_conn_ids.add(connector_id)
+            connector = {
+                "id": connector_id,
+                "type": "StreamConnector",
+                "source": source_id,
+                "target": stream_id,
+                "properties": {},
+                "metadata": {"stream_point": True, "side": "outlet_connector"},
+            }
+            config["connections"].append(connector)
+            existing_conns[connector_id] = connector
 
     for ic in plan.all_inter_connections:
         for cd in stream_conns_by_stage.get(ic.target_stage, []):
             if cd["id"] == ic.inlet_mfc_id:
-                if cd["id"] not in existing_conn_ids:
+                existing_cd = existing_conns.get(cd["id"])
+                if existing_cd is None:
                     config["connections"].append(cd)
                 else:
                     # Update mdot on a placeholder connection added by preseed.
                     new_mdot = (cd.get("properties") or {}).get("mass_flow_rate")
                     if new_mdot is not None and new_mdot > 0:
-                        for existing_cd in config["connections"]:
-                            if existing_cd["id"] == cd["id"]:
-                                existing_cd.setdefault("properties", {})[
-                                    "mass_flow_rate"
-                                ] = new_mdot
-                                break
+                        existing_cd.setdefault("properties", {})["mass_flow_rate"] = (
+                            new_mdot
+                        )
 
 
 # Backward-compatible alias
@@ -404,6 +404,41 @@ def config_to_cyto_elements(config: Dict[str, Any]) -> List[Dict[str, Any]]:
     return elements
 
 
+#: Data-directory files that are not reaction mechanisms (tests, examples,
+#: transport/thermo-only data, ...), matched case-insensitively anywhere in
+#: the filename.
+_MECHANISM_EXCLUDE_RE = re.compile(
+    "test|example|tutorial|sample|demo|validation|transport|pre-commit"
+    "|config|template|species|thermo",
+    re.IGNORECASE,
+)
+
+#: Display labels for well-known mechanisms, by filename.
+_KNOWN_MECHANISM_LABELS: Dict[str, str] = {
+    "gri30.yaml": "GRI 3.0 (Natural Gas Combustion)",
+    "h2o2.yaml": "H2/O2 (Hydrogen Combustion)",
+    "air.yaml": "Air (Ideal Gas Properties)",
+}
+
+#: Fuel hint appended to other labels, in priority order ("methane" before
+#: "ethane", which it contains).
+_MECHANISM_FUELS = ("methane", "hydrogen", "ethane")
+
+
+def _mechanism_label(filename: str) -> str:
+    """Readable dropdown label for a mechanism file."""
+    known = _KNOWN_MECHANISM_LABELS.get(filename)
+    if known is not None:
+        return known
+    label = filename.replace(".yaml", "").replace(".yml", "").replace("_", " ")
+    label = " ".join(word.capitalize() for word in label.split())
+    lowered = filename.lower()
+    for fuel in _MECHANISM_FUELS:
+        if fuel in lowered:
+            return f"{label} ({fuel.capitalize()})"
+    return label
+
+
 @lru_cache(maxsize=1)
 def get_available_cantera_mechanisms() -> List[Dict[str, str]]:
     """Get all available Cantera mechanism files from data directories.
@@ -436,21 +471,6 @@ def get_available_cantera_mechanisms() -> List[Dict[str, str]]:
                 yaml_files.update(data_path.glob(ext))
 
     # Convert to dropdown options, excluding some internal/test files
-    exclude_patterns = [
-        "test",
-        "example",
-        "tutorial",
-        "sample",
-        "demo",
-        "validation",
-        "transport",
-        "pre-commit",
-        "config",
-        "template",
-        "species",
-        "thermo",
-    ]
-
     # Use a set to track filenames and avoid duplicates
     seen_filenames = set()
 
@@ -462,59 +482,45 @@ def get_available_cantera_mechanisms() -> List[Dict[str, str]]:
             continue
 
         # Skip files that match exclude patterns or don't seem like mechanism files
-        if any(pattern in filename.lower() for pattern in exclude_patterns):
+        if _MECHANISM_EXCLUDE_RE.search(filename):
             continue
 
         # Skip files that are clearly not mechanism files (dot files, etc)
         if filename.startswith(".") or len(filename) < 5:
             continue
 
-        # Skip duplicate filenames (same file in multiple directories)
-        if filename in seen_filenames:
-            continue
-
         # Mark this filename as seen
         seen_filenames.add(filename)
 
-        # Create a readable label
-        label = filename.replace(".yaml", "").replace(".yml", "").replace("_", " ")
-        label = " ".join(word.capitalize() for word in label.split())
-
-        # Add special descriptions for known mechanisms
-        if filename == "gri30.yaml":
-            label = "GRI 3.0 (Natural Gas Combustion)"
-        elif filename == "h2o2.yaml":
-            label = "H2/O2 (Hydrogen Combustion)"
-        elif filename == "air.yaml":
-            label = "Air (Ideal Gas Properties)"
-        elif "methane" in filename.lower():
-            label += " (Methane)"
-        elif "hydrogen" in filename.lower():
-            label += " (Hydrogen)"
-        elif "ethane" in filename.lower():
-            label += " (Ethane)"
-
-        mechanisms.append({"label": label, "value": filename})
+        mechanisms.append({"label": _mechanism_label(filename), "value": filename})
 
     return mechanisms
 
 
+#: Property key → display label with unit, for :func:`label_with_unit`.
+_LABELS_WITH_UNIT: Dict[str, str] = {
+    "pressure": "pressure (Pa)",
+    "composition": "composition (%mol)",
+    "temperature": "temperature (°C)",
+    "mass_flow_rate": "mass flow rate (kg/s)",
+    "volume": "volume (m³)",
+    "valve_coeff": "valve coefficient (-)",
+}
+
+
 def label_with_unit(key: str) -> str:
     """Add units to property labels for display."""
-    unit_map = {
-        "pressure": "pressure (Pa)",
-        "composition": "composition (%mol)",
-        "temperature": "temperature (°C)",
-        "mass_flow_rate": "mass flow rate (kg/s)",
-        "volume": "volume (m³)",
-        "valve_coeff": "valve coefficient (-)",
-    }
-    return unit_map.get(key, key)
+    return _LABELS_WITH_UNIT.get(key, key)
 
 
 # Plot theme utilities
+@lru_cache(maxsize=4)
 def get_plotly_theme_template(theme: str = "light") -> Dict[str, Any]:
-    """Get Plotly theme template based on the current theme."""
+    """Get Plotly theme template based on the current theme.
+
+    Cached per theme like :func:`get_sankey_theme_config`; callers must copy
+    before modifying the returned dict.
+    """
     if theme == "dark":
         return {
             "layout": {
@@ -609,8 +615,13 @@ def get_plotly_theme_template(theme: str = "light") -> Dict[str, Any]:
         }
 
 
+@lru_cache(maxsize=4)
 def get_sankey_theme_config(theme: str = "light") -> Dict[str, Any]:
-    """Get theme-specific Sankey diagram configuration."""
+    """Get theme-specific Sankey diagram configuration.
+
+    Cached per theme: every call returns the same dict, so callers must copy
+    before modifying it.
+    """
     if theme == "dark":
         return {
             "paper_bgcolor": "#1a1a1a",
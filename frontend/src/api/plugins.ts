@@ -5,10 +5,18 @@ export function fetchPlugins() {
   return apiFetch<PluginMeta[]>("/plugins");
 }
 
+/**
+ * Render a plugin for the given context.
+ *
+ * Pass ``simulation_id`` instead of ``simulation_data`` for results the
+ * server still holds: it resolves them itself, so a render does not re-post
+ * the full time series. The server answers 404 once it has dropped them.
+ */
 export function renderPlugin(
   pluginId: string,
   context: {
     simulation_data?: Record<string, unknown> | null;
+    simulation_id?: string | null;
     selected_element?: Record<string, unknown> | null;
     config?: Record<string, unknown> | null;
     theme?: string;
@@ -9,6 +9,7 @@ import { useSimulationStore } from "@/stores/simulationStore";
 import { useThemeStore } from "@/stores/themeStore";
 import { useAddEntityModalStore } from "@/stores/addEntityModalStore";
 import { useSweepRunStore } from "@/stores/sweepStore";
+import { failedRunStatus, findFailedStageId } from "@/lib/failedStage";
 
 /**
  * Per-node problem badges (top-right corner), drawn as self-contained SVG
@@ -108,18 +109,23 @@ export function ReactorGraph() {
   // Nodes that are skip_viz but produce no such outgoing-to-child connections are
   // rendered normally (e.g. RefractoryReactor in A3/A4 whose segments are not
   // exposed as individual nodes in the visualisation).
+  // One pass over the connections against a set of skip_viz ids, rather
+  // than rescanning every connection for each skip_viz node.
   const trulyHiddenNodeIds = useMemo<Set<string>>(() => {
-    const hidden = new Set<string>();
+    const skipViz = new Set<string>();
     for (const node of config.nodes) {
-      if (!node.metadata?.skip_viz) continue;
-      const prefix = `${node.id}_`;
-      const hasChildConn = config.connections.some(
-        (c) =>
-          c.source === node.id &&
-          c.target.startsWith(prefix) &&
-          c.type !== "Wall",
-      );
-      if (hasChildConn) hidden.add(node.id);
+      if (node.metadata?.skip_viz) skipViz.add(node.id);
+    }
+    const hidden = new Set<string>();
+    if (skipViz.size === 0) return hidden;
+    for (const c of config.connections) {
+      if (
+        c.type !== "Wall" &&
+        skipViz.has(c.source) &&
+        c.target.startsWith(`${c.source}_`)
+      ) {
+        hidden.add(c.source);
+      }
     }
     return hidden;
   }, [config.nodes, config.connections]);
@@ -201,7 +207,9 @@ export function ReactorGraph() {
       const parentId = `group:${groupName}`;
       if (!createdGroups.has(parentId)) {
         createdGroups.add(parentId);
-        elements.push({ data: { id: parentId, label: groupName, isGroup: true } });
+        elements.push({
+          data: { id: parentId, label: groupName, stage: groupName, isGroup: true },
+        });
       }
     };
 
@@ -294,7 +302,7 @@ export function ReactorGraph() {
         label: streamLabel,
         type: node.type,
         temperature: Number(node.properties?.temperature ?? 300),
-        ...(!isStreamPoint && group ? { parent: `group:${group}` } : {}),
+        ...(!isStreamPoint && group ? { parent: `group:${group}`, stage: group } : {}),
       };
       if (isStreamPoint) nodeData.stream_point = true;
       elements.push({ data: nodeData });
@@ -938,17 +946,16 @@ export function ReactorGraph() {
     // Parallel feed reservoirs should not share the main-flow spine: only the
     // first (lowest layout_order) stays on main_flow; extras anchor above/below
     // their downstream reactor so inlet edges do not cross sibling feeds.
+    const feedsMainIds = new Set<string>();
+    for (const conn of config.connections) {
+      if (nodeToLane.get(conn.target) === LAYOUT_LANE_MAIN) feedsMainIds.add(conn.source);
+    }
     const mainFeedReservoirs: string[] = [];
     for (const node of config.nodes) {
       if (node.metadata?.skip_viz) continue;
       if (nodeToLane.get(node.id) !== LAYOUT_LANE_MAIN) continue;
       if (node.type !== "Reservoir") continue;
-      const feedsMain = config.connections.some(
-        (conn) =>
-          conn.source === node.id &&
-          nodeToLane.get(conn.target) === LAYOUT_LANE_MAIN,
-      );
-      if (feedsMain) mainFeedReservoirs.push(node.id);
+      if (feedsMainIds.has(node.id)) mainFeedReservoirs.push(node.id);
     }
     if (mainFeedReservoirs.length > 1) {
       mainFeedReservoirs.sort(
@@ -1412,10 +1419,9 @@ export function ReactorGraph() {
       if (data.isGroup) {
         // Compound group box tapped — select the group so the Plots tab
         // can show the stage-level aggregated profile (e.g. full CGR).
-        // Use the plain stage name (strip "group:" prefix) as the id so
+        // Use the plain stage name (not the "group:"-prefixed element id) so
         // it aligns with reactors_series keys produced by the backend.
-        const rawId = String(data.id ?? "");
-        const stageId = rawId.startsWith("group:") ? rawId.slice("group:".length) : rawId;
+        const stageId = String(data.stage ?? data.id ?? "");
         setSelectedElement({
           type: "node",
           data: { ...data, id: stageId, isGroup: true, label: stageId },
@@ -1476,8 +1482,7 @@ export function ReactorGraph() {
       const data = e.target.data();
       if (data.stream_point) return;
       if (data.isGroup) {
-        const rawId = String(data.id ?? "");
-        const stageId = rawId.startsWith("group:") ? rawId.slice("group:".length) : rawId;
+        const stageId = String(data.stage ?? data.id ?? "");
         useAddEntityModalStore.getState().openAddReactor({ group: stageId });
         return;
       }
@@ -1562,15 +1567,30 @@ export function ReactorGraph() {
   //    This is simpler and more correct than an incremental diff, which has
   //    hard-to-debug edge cases around compound nodes and synthesised edges.
   //  - If fingerprint changed (or first render) → run full dagre layout.
+  //
+  // Many config changes don't change the graph at all (a pressure or
+  // composition edit: neither is shown on the canvas), so the data-only path
+  // first compares a signature of the rebuilt elements plus the node metadata
+  // that drives positioning (layout lanes, drag offsets) against the last one
+  // applied, and leaves the canvas alone when nothing visible changed.
   const isFirstLayoutRef = useRef(true);
+  const appliedSignatureRef = useRef("");
   useEffect(() => {
     const cy = cyRef.current;
     if (!cy) return;
 
     const newFingerprint = computeFingerprint();
     const isFirst = isFirstLayoutRef.current;
+    const elements = buildElements();
+    const signature = JSON.stringify([
+      elements,
+      config.nodes.map((n) => [n.id, n.metadata ?? null]),
+    ]);
 
     if (!isFirst && newFingerprint === topoFingerprintRef.current) {
+      if (signature === appliedSignatureRef.current) return;
+      appliedSignatureRef.current = signature;
+
       // Authored topology unchanged — no dagre pass needed.
       // Save viewport, replace all elements (so synthesised edges are always
       // rebuilt correctly regardless of what the server put in config.connections),
@@ -1578,7 +1598,7 @@ export function ReactorGraph() {
       const pan = cy.pan();
       const zoom = cy.zoom();
 
-      cy.json({ elements: buildElements() });
+      cy.json({ elements });
 
       // Restore natural positions (set during last full dagre layout).
       cy.nodes().forEach((n: cytoscape.NodeSingular) => {
@@ -1609,10 +1629,11 @@ export function ReactorGraph() {
     // simulation-transient stream-point changes (excluded from fingerprint).
     topoFingerprintRef.current = newFingerprint;
     isFirstLayoutRef.current = false;
+    appliedSignatureRef.current = signature;
 
-    cy.json({ elements: buildElements() });
+    cy.json({ elements });
     void runGraphLayout(cy, !isFirst);
-  }, [buildElements, computeFingerprint, runGraphLayout]);
+  }, [buildElements, computeFingerprint, runGraphLayout, config.nodes]);
 
   // Update stylesheet when theme changes
   useEffect(() => {
@@ -1667,13 +1688,11 @@ export function ReactorGraph() {
     }
 
     if (error && !isRunning) {
-      const completed = new Set(progress?.completed_stage_ids ?? []);
-      const failedStageId = Object.keys(config.groups ?? {}).find((id) => !completed.has(id));
-      cy.nodes().forEach((n) => {
-        const group = n.data("parent") as string | undefined;
-        const stageId = group?.startsWith("group:") ? group.slice("group:".length) : undefined;
-        setStatus(n, stageId && stageId === failedStageId ? "error" : null);
-      });
+      const failedStageId = findFailedStageId(
+        Object.keys(config.groups ?? {}),
+        progress?.completed_stage_ids ?? [],
+      );
+      cy.nodes().forEach((n) => setStatus(n, failedRunStatus(n.data(), failedStageId)));
       return;
     }
 
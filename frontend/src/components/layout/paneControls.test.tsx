@@ -1,13 +1,15 @@
 /**
  * Asserts PaneToggle: nudges toward Ctrl+B after repeatedly clicking the
  * left-sidebar toggle by mouse, and never nudges the right-sidebar toggle
- * (it has no keyboard shortcut).
+ * (it has no keyboard shortcut). Also asserts PaneResizer sizes its pane
+ * directly while dragging and commits the clamped width to the store once,
+ * on release.
  */
 
 import { describe, it, expect, vi, beforeEach } from "vitest";
 import { render, screen, fireEvent } from "@testing-library/react";
 import "@testing-library/jest-dom";
-import { PaneToggle } from "./paneControls";
+import { PaneResizer, PaneToggle } from "./paneControls";
 
 const mockToastInfo = vi.fn();
 vi.mock("sonner", () => ({
@@ -16,12 +18,16 @@ vi.mock("sonner", () => ({
 
 const mockToggleLeft = vi.fn();
 const mockToggleRight = vi.fn();
-vi.mock("@/stores/layoutStore", () => ({
+const mockSetLeftWidth = vi.fn();
+vi.mock("@/stores/layoutStore", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("@/stores/layoutStore")>()),
   useLayoutStore: () => ({
     leftCollapsed: false,
     rightCollapsed: false,
     toggleLeft: mockToggleLeft,
     toggleRight: mockToggleRight,
+    leftWidth: 300,
+    setLeftWidth: mockSetLeftWidth,
   }),
 }));
 
@@ -53,3 +59,31 @@ describe("PaneToggle", () => {
     expect(mockToastInfo).not.toHaveBeenCalled();
   });
 });
+
+describe("PaneResizer", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("sizes the pane while dragging and commits the clamped width once on release", () => {
+    const { container } = render(
+      <div>
+        <aside data-testid="pane" style={{ width: 300 }} />
+        <PaneResizer side="left" />
+      </div>,
+    );
+    const handle = container.querySelector('[role="separator"]')!;
+    const pane = screen.getByTestId("pane");
+
+    fireEvent(handle, new MouseEvent("pointerdown", { bubbles: true, clientX: 0 }));
+    window.dispatchEvent(new MouseEvent("pointermove", { clientX: 50 }));
+    window.dispatchEvent(new MouseEvent("pointermove", { clientX: 5000 }));
+
+    expect(pane.style.width).toBe("600px");
+    expect(mockSetLeftWidth).not.toHaveBeenCalled();
+
+    window.dispatchEvent(new MouseEvent("pointerup"));
+    expect(mockSetLeftWidth).toHaveBeenCalledOnce();
+    expect(mockSetLeftWidth).toHaveBeenCalledWith(600);
+  });
+});
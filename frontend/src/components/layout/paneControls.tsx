@@ -1,5 +1,5 @@
 import { PanelLeft, PanelRight } from "lucide-react";
-import { useLayoutStore } from "@/stores/layoutStore";
+import { clampPaneWidth, useLayoutStore } from "@/stores/layoutStore";
 import { useShortcutNudge } from "@/hooks/useShortcutNudge";
 
 /** Notify canvas-based components (Cytoscape, Plotly) that the layout changed. */
@@ -35,7 +35,13 @@ export function PaneToggle({ side }: { side: "left" | "right" }) {
   );
 }
 
-/** Draggable vertical divider that resizes the adjacent sidebar. */
+/**
+ * Draggable vertical divider that resizes the adjacent sidebar.
+ *
+ * While dragging, the new width is written straight onto the pane element;
+ * the layout store (and with it AppShell, the graph and the results) is only
+ * updated once, on release -- not re-rendered on every pointermove.
+ */
 export function PaneResizer({ side }: { side: "left" | "right" | "yaml" }) {
   const { leftWidth, rightWidth, yamlWidth, setLeftWidth, setRightWidth, setYamlWidth } =
     useLayoutStore();
@@ -44,20 +50,29 @@ export function PaneResizer({ side }: { side: "left" | "right" | "yaml" }) {
     e.preventDefault();
     const startX = e.clientX;
     const startW = side === "left" ? leftWidth : side === "right" ? rightWidth : yamlWidth;
+    // The pane this divider sizes: AppShell renders the left sidebar before
+    // its divider, the right-hand panes after theirs.
+    const handle = e.currentTarget as HTMLElement;
+    const pane = (
+      side === "left" ? handle.previousElementSibling : handle.nextElementSibling
+    ) as HTMLElement | null;
+    let width = startW;
 
     const onMove = (ev: PointerEvent) => {
       const delta = ev.clientX - startX;
       // "left" widens to the right (dragging right grows it); "right" and
       // "yaml" both sit right of center and widen to the left.
-      if (side === "left") setLeftWidth(startW + delta);
-      else if (side === "right") setRightWidth(startW - delta);
-      else setYamlWidth(startW - delta);
+      width = clampPaneWidth(side, side === "left" ? startW + delta : startW - delta);
+      if (pane) pane.style.width = `${width}px`;
     };
     const onUp = () => {
       window.removeEventListener("pointermove", onMove);
       window.removeEventListener("pointerup", onUp);
       document.body.style.cursor = "";
       document.body.style.userSelect = "";
+      if (side === "left") setLeftWidth(width);
+      else if (side === "right") setRightWidth(width);
+      else setYamlWidth(width);
       nudgeResize();
     };
     document.body.style.cursor = "col-resize";
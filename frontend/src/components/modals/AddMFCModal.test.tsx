@@ -16,7 +16,10 @@ let mockNodes: Record<string, unknown>[] = [
 ];
 const mockAddConnection = vi.fn();
 
-vi.mock("@/stores/configStore", () => ({
+// Keep the module's pure helpers (findById, collectStageGroups, ...) real;
+// only the store hook is swapped for the test's fixture state.
+vi.mock("@/stores/configStore", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("@/stores/configStore")>()),
   useConfigStore: (selector: (s: unknown) => unknown) =>
     selector({
       addConnection: mockAddConnection,
@@ -1,8 +1,8 @@
 import { useMemo, useState } from "react";
-import { useConfigStore } from "@/stores/configStore";
+import { collectStageGroups, useConfigStore } from "@/stores/configStore";
 import { useKinds } from "@/hooks/useKinds";
 import { Button } from "@/components/ui/Button";
-import { Tooltip } from "@/components/ui/Tooltip";
+import { KindDocTooltip } from "@/components/ui/KindDocTooltip";
 import { toast } from "sonner";
 
 interface Props {
@@ -30,14 +30,10 @@ export function AddMFCModal({ open, onClose, defaultGroup, defaultSource }: Prop
     [connectionKinds],
   );
 
-  const stages = useMemo(() => {
-    const groups = new Set(
-      [...nodes.map((n) => n.group), ...connections.map((c) => c.group)].filter(
-        (g): g is string => typeof g === "string" && g.length > 0,
-      ),
-    );
-    return [...groups].sort();
-  }, [nodes, connections]);
+  const stages = useMemo(
+    () => [...collectStageGroups(nodes, connections)].sort(),
+    [nodes, connections],
+  );
 
   const [id, setId] = useState("");
   const [type, setType] = useState(connectionTypes[0]);
@@ -83,10 +79,11 @@ export function AddMFCModal({ open, onClose, defaultGroup, defaultSource }: Prop
         group || undefined,
       );
       toast.success(`Connection "${trimmedId}" added`);
-      setId("");
-      setFlowRate("0.001");
+      // Closing unmounts the modal (AppShell keys it on open state), so no
+      // manual form reset is needed — see AddReactorModal.
       onClose();
     } catch (err) {
+      // Duplicate id: keep the modal open with the form intact.
       toast.error(err instanceof Error ? err.message : String(err));
     }
   };
@@ -123,30 +120,7 @@ export function AddMFCModal({ open, onClose, defaultGroup, defaultSource }: Prop
                 <option key={t}>{t}</option>
               ))}
             </select>
-            {selectedDoc?.doc_url && (
-              <Tooltip
-                content={
-                  <span className="block space-y-1">
-                    <span className="block">{selectedDoc.description}</span>
-                    <a
-                      href={selectedDoc.doc_url}
-                      target="_blank"
-                      rel="noreferrer"
-                      className="underline text-primary"
-                    >
-                      Docs
-                    </a>
-                  </span>
-                }
-              >
-                <span
-                  className="flex h-6 w-6 shrink-0 items-center justify-center rounded-full text-muted-foreground cursor-help"
-                  aria-label={`About ${effectiveType}`}
-                >
-                  ⓘ
-                </span>
-              </Tooltip>
-            )}
+            <KindDocTooltip doc={selectedDoc} kind={effectiveType} />
           </div>
         </label>
 
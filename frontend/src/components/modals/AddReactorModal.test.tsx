@@ -1,8 +1,8 @@
 /**
  * Asserts AddReactorModal: falls back to a fixed type list when /api/ui/kinds
  * hasn't resolved, only shows the Stage picker when the config has more than
- * one stage, pre-selects defaultGroup, and calls addNode with the chosen
- * type/group on submit.
+ * one stage, pre-selects defaultGroup, calls addNode with the chosen
+ * type/group on submit, and only closes once addNode accepts the id.
  */
 
 import { describe, it, expect, vi, beforeEach } from "vitest";
@@ -14,7 +14,10 @@ let mockNodes: Record<string, unknown>[] = [];
 let mockConnections: Record<string, unknown>[] = [];
 const mockAddNode = vi.fn();
 
-vi.mock("@/stores/configStore", () => ({
+// Keep the module's pure helpers (findById, collectStageGroups, ...) real;
+// only the store hook is swapped for the test's fixture state.
+vi.mock("@/stores/configStore", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("@/stores/configStore")>()),
   useConfigStore: (selector: (s: unknown) => unknown) =>
     selector({ addNode: mockAddNode, config: { nodes: mockNodes, connections: mockConnections } }),
 }));
@@ -92,6 +95,23 @@ describe("AddReactorModal", () => {
     );
   });
 
+  it("closes after a successful add and stays open when addNode rejects a duplicate id", () => {
+    const onClose = vi.fn();
+    render(<AddReactorModal open onClose={onClose} />);
+    fireEvent.change(screen.getByLabelText("Reactor ID"), { target: { value: "r1" } });
+
+    mockAddNode.mockImplementationOnce(() => {
+      throw new Error("Node with ID r1 already exists");
+    });
+    fireEvent.click(screen.getByRole("button", { name: "Add" }));
+    expect(onClose).not.toHaveBeenCalled();
+    expect((screen.getByLabelText("Reactor ID") as HTMLInputElement).value).toBe("r1");
+
+    fireEvent.click(screen.getByRole("button", { name: "Add" }));
+    expect(mockAddNode).toHaveBeenCalledTimes(2);
+    expect(onClose).toHaveBeenCalledTimes(1);
+  });
+
   it("rejects an empty reactor ID without calling addNode", () => {
     render(<AddReactorModal open onClose={vi.fn()} />);
     fireEvent.click(screen.getByRole("button", { name: "Add" }));
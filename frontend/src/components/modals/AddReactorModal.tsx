@@ -1,9 +1,9 @@
 import { useMemo, useState } from "react";
-import { useConfigStore } from "@/stores/configStore";
+import { collectStageGroups, useConfigStore } from "@/stores/configStore";
 import { useKinds } from "@/hooks/useKinds";
 import { celsiusToKelvin } from "@/lib/units";
 import { Button } from "@/components/ui/Button";
-import { Tooltip } from "@/components/ui/Tooltip";
+import { KindDocTooltip } from "@/components/ui/KindDocTooltip";
 import { toast } from "sonner";
 
 interface Props {
@@ -32,14 +32,10 @@ export function AddReactorModal({ open, onClose, defaultGroup }: Props) {
 
   // Only offer a stage picker when the config actually has more than one —
   // otherwise the new reactor unambiguously belongs to the single stage.
-  const stages = useMemo(() => {
-    const groups = new Set(
-      [...nodes.map((n) => n.group), ...connections.map((c) => c.group)].filter(
-        (g): g is string => typeof g === "string" && g.length > 0,
-      ),
-    );
-    return [...groups].sort();
-  }, [nodes, connections]);
+  const stages = useMemo(
+    () => [...collectStageGroups(nodes, connections)].sort(),
+    [nodes, connections],
+  );
 
   const [id, setId] = useState("");
   const [type, setType] = useState(reactorTypes[0]);
@@ -77,13 +73,13 @@ export function AddReactorModal({ open, onClose, defaultGroup }: Props) {
         group || undefined,
       );
       toast.success(`Reactor "${trimmedId}" added`);
-      // Reset & close
-      setId("");
-      setTemp("1000");
-      setPressure("101325");
-      setComposition("O2:1,N2:3.76");
+      // One store update, then close. No manual form reset: AppShell keys this
+      // modal on its open state, so closing unmounts it and the next open
+      // starts from fresh defaults.
       onClose();
     } catch (err) {
+      // Duplicate id (thrown by addNode): keep the modal open so the user
+      // can fix the id without re-entering the rest of the form.
       toast.error(err instanceof Error ? err.message : String(err));
     }
   };
@@ -121,30 +117,7 @@ export function AddReactorModal({ open, onClose, defaultGroup }: Props) {
                 <option key={t}>{t}</option>
               ))}
             </select>
-            {selectedDoc?.doc_url && (
-              <Tooltip
-                content={
-                  <span className="block space-y-1">
-                    <span className="block">{selectedDoc.description}</span>
-                    <a
-                      href={selectedDoc.doc_url}
-                      target="_blank"
-                      rel="noreferrer"
-                      className="underline text-primary"
-                    >
-                      Docs
-                    </a>
-                  </span>
-                }
-              >
-                <span
-                  className="flex h-6 w-6 shrink-0 items-center justify-center rounded-full text-muted-foreground cursor-help"
-                  aria-label={`About ${effectiveType}`}
-                >
-                  ⓘ
-                </span>
-              </Tooltip>
-            )}
+            <KindDocTooltip doc={selectedDoc} kind={effectiveType} />
           </div>
         </label>
 
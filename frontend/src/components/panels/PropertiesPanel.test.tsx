@@ -58,7 +58,10 @@ vi.mock("@/stores/selectionStore", () => ({
   },
 }));
 
-vi.mock("@/stores/configStore", () => ({
+// Keep the module's pure helpers (findById, collectStageGroups, ...) real;
+// only the store hook is swapped for the test's fixture state.
+vi.mock("@/stores/configStore", async (importOriginal) => ({
+  ...(await importOriginal<typeof import("@/stores/configStore")>()),
   useConfigStore: (selector: (s: unknown) => unknown) => {
     const store = {
       config: mockConfig,
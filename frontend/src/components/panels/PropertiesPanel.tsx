@@ -1,38 +1,35 @@
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect, useRef, type ReactNode } from "react";
 import { useSelectionStore } from "@/stores/selectionStore";
-import { useConfigStore } from "@/stores/configStore";
+import { findById, getSoleGroup, useConfigStore } from "@/stores/configStore";
 import { useScenarioStore } from "@/stores/scenarioStore";
 import { useSimulationStore } from "@/stores/simulationStore";
 import { useSweepRunStore } from "@/stores/sweepStore";
 import { BASELINE_SCENARIO_ID, updateScenarioEntity } from "@/api/scenarios";
-import type { NormalizedConfig } from "@/types/config";
 import { kelvinToCelsius, celsiusToKelvin, formatNumber, labelWithUnit } from "@/lib/units";
 import { useKindSchema } from "@/hooks/useKindSchema";
 import { useKinds } from "@/hooks/useKinds";
 import { Button } from "@/components/ui/Button";
-import { Tooltip } from "@/components/ui/Tooltip";
+import { KindDocTooltip } from "@/components/ui/KindDocTooltip";
 import { ConfirmDeleteNodeModal } from "@/components/modals/ConfirmDeleteNodeModal";
 import { StageCard } from "@/components/panels/StageCard";
 import { toast } from "sonner";
 
-/** The config's one stage, when it has exactly one — undefined for 0 or 2+. */
-function getSoleGroup(config: NormalizedConfig): string | undefined {
-  const groups = new Set(
-    [...config.nodes.map((n) => n.group), ...config.connections.map((c) => c.group)].filter(
-      (g): g is string => typeof g === "string" && g.length > 0,
-    ),
-  );
-  return groups.size === 1 ? [...groups][0] : undefined;
-}
-
 // Display-order keys that should always render last, regardless of where
 // they land in the underlying properties dict (e.g. `plot_options` is
 // metadata about *how* to chart the node, not a physical initial condition).
 const _TRAILING_DISPLAY_KEYS = ["plot_options"];
 
+// Unfolded view per properties object. Store entries are immutable and keep
+// their identity across edits to *other* elements, so the panel's re-render on
+// every config change reuses the previous result instead of re-flattening.
+// Callers treat the result as read-only.
+const unfoldedCache = new WeakMap<Record<string, unknown>, Record<string, unknown>>();
+
 function unfoldInitialConditions(
   properties: Record<string, unknown>,
 ): Record<string, unknown> {
+  const cached = unfoldedCache.get(properties);
+  if (cached) return cached;
   const flat = { ...properties };
   const initial = flat.initial;
   if (initial && typeof initial === "object" && !Array.isArray(initial)) {
@@ -60,9 +57,20 @@ function unfoldInitialConditions(
       flat[key] = value;
     }
   }
+  unfoldedCache.set(properties, flat);
   return flat;
 }
 
+/** One label/value line of the read-only Material Stream summary. */
+function StreamRow({ label, children }: { label: string; children: ReactNode }) {
+  return (
+    <div className="py-1 flex justify-between gap-2">
+      <span className="text-muted-foreground">{label}</span>
+      <span className="font-mono">{children}</span>
+    </div>
+  );
+}
+
 /** Render a property value the same way for the display span and override tooltips. */
 function formatDisplayValue(key: string, value: unknown): string {
   if (key === "temperature" && typeof value === "number") {
@@ -95,7 +103,20 @@ function buildEditValuesFromProperties(
 export function PropertiesPanel() {
   const selectedElement = useSelectionStore((s) => s.selectedElement);
   const initialConditionsEditNonce = useSelectionStore((s) => s.initialConditionsEditNonce);
-  const config = useConfigStore((s) => s.config);
+  // Subscribe to the selected element's own config entry (and, with nothing
+  // selected, the sole stage id) rather than the whole config: edits
+  // elsewhere in the network -- dragging another node, editing another
+  // reactor -- leave both unchanged, so the panel skips re-rendering. The
+  // entry is resolved once here and reused below as the entity shown/edited.
+  const selectedId = selectedElement ? String(selectedElement.data.id) : "";
+  const selectedConfigEntity = useConfigStore((s) =>
+    selectedElement && !selectedElement.data.isGroup
+      ? selectedElement.type === "node"
+        ? findById(s.config.nodes, selectedId)
+        : findById(s.config.connections, selectedId)
+      : undefined,
+  );
+  const soleGroup = useConfigStore((s) => (selectedElement ? undefined : getSoleGroup(s.config)));
   const updateNode = useConfigStore((s) => s.updateNode);
   const updateConnection = useConfigStore((s) => s.updateConnection);
   const removeNode = useConfigStore((s) => s.removeNode);
@@ -137,10 +158,7 @@ export function PropertiesPanel() {
       }
 
       const isNode = element.type === "node";
-      const id = String(element.data.id);
-      const entity = isNode
-        ? config.nodes.find((n) => n.id === id)
-        : config.connections.find((c) => c.id === id);
+      const entity = selectedConfigEntity;
       if (!entity) {
         setIsEditing(false);
         return;
@@ -163,7 +181,7 @@ export function PropertiesPanel() {
     if (elementChanged) {
       setIsEditing(false);
     }
-  }, [selectedElement, initialConditionsEditNonce, config]);
+  }, [selectedElement, initialConditionsEditNonce, selectedConfigEntity]);
 
   // The kind of the selected element. A selection made from the graph carries
   // `type` in its cytoscape data, but a programmatic one need not — selecting
@@ -171,13 +189,6 @@ export function PropertiesPanel() {
   // setActive). The config entry always has the kind, so fall back to it;
   // otherwise both the heading below and the schema lookup here come up empty
   // whenever a scenario is being previewed.
-  const selectedConfigEntity =
-    selectedElement && !selectedElement.data.isGroup
-      ? (selectedElement.type === "node"
-          ? config.nodes.find((n) => n.id === String(selectedElement.data.id))
-          : config.connections.find((c) => c.id === String(selectedElement.data.id)))
-      : undefined;
-
   // Field metadata from the kind's registered schema (descriptions, enum
   // options, conditional visibility). Fetched before any early return so
   // the hook order stays stable.
@@ -192,7 +203,6 @@ export function PropertiesPanel() {
     // A config with exactly one stage has no clickable stage box (see
     // ReactorGraph's suppressDefaultGroup) — show that stage's panel by
     // default instead, so its solver controls are still reachable.
-    const soleGroup = getSoleGroup(config);
     if (soleGroup) {
       return <StageCard stageId={soleGroup} />;
     }
@@ -206,7 +216,7 @@ export function PropertiesPanel() {
   }
 
   const isNode = selectedElement.type === "node";
-  const id = String(selectedElement.data.id);
+  const id = selectedId;
   const entityType = schemaKind;
   const kindDoc = (isNode ? reactors : connections).find((k) => k.kind === entityType);
 
@@ -216,9 +226,7 @@ export function PropertiesPanel() {
   }
 
   // Get full properties from config store (graph data may be subset)
-  const entity = isNode
-    ? config.nodes.find((n) => n.id === id)
-    : config.connections.find((c) => c.id === id);
+  const entity = selectedConfigEntity;
 
   const properties = entity ? (entity.properties as Record<string, unknown>) : {};
   const displayProperties = unfoldInitialConditions(properties);
@@ -416,32 +424,7 @@ export function PropertiesPanel() {
           <h3 className="font-semibold text-sm text-foreground">{id}</h3>
           <div className="flex items-center gap-1">
             <span className="text-xs text-muted-foreground">{entityType}</span>
-            {kindDoc?.doc_url && (
-              <Tooltip
-                content={
-                  <span className="block space-y-1">
-                    {kindDoc.description && (
-                      <span className="block">{kindDoc.description}</span>
-                    )}
-                    <a
-                      href={kindDoc.doc_url}
-                      target="_blank"
-                      rel="noreferrer"
-                      className="underline text-primary"
-                    >
-                      Docs
-                    </a>
-                  </span>
-                }
-              >
-                <span
-                  className="flex h-4 w-4 shrink-0 items-center justify-center rounded-full text-[10px] text-muted-foreground cursor-help"
-                  aria-label={`About ${entityType}`}
-                >
-                  ⓘ
-                </span>
-              </Tooltip>
-            )}
+            <KindDocTooltip doc={kindDoc} kind={entityType} compact />
           </div>
         </div>
         {!isComputedStream && (
@@ -481,13 +464,14 @@ export function PropertiesPanel() {
               !isEditing &&
               Boolean(previewEntity) &&
               JSON.stringify(value) !== JSON.stringify(displayProperties[key]);
+            const tooltip = fieldTooltip(key);
             return (
             <div key={key} className="py-1.5 flex items-center justify-between gap-2">
               <span
                 className={`text-xs text-muted-foreground truncate ${
-                  fieldTooltip(key) ? "cursor-help underline decoration-dotted" : ""
+                  tooltip ? "cursor-help underline decoration-dotted" : ""
                 }`}
-                title={fieldTooltip(key)}
+                title={tooltip}
               >
                 {labelWithUnit(key)}
               </span>
@@ -548,76 +532,41 @@ export function PropertiesPanel() {
           </p>
           <div className="divide-y divide-border text-xs">
             {properties.source_node != null && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">Source</span>
-                <span className="font-mono">{String(properties.source_node)}</span>
-              </div>
+              <StreamRow label="Source">{String(properties.source_node)}</StreamRow>
             )}
             {Array.isArray(properties.target_nodes) && properties.target_nodes.length > 0 && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">Target(s)</span>
-                <span className="font-mono">
-                  {(properties.target_nodes as unknown[]).map(String).join(", ")}
-                </span>
-              </div>
+              <StreamRow label="Target(s)">
+                {(properties.target_nodes as unknown[]).map(String).join(", ")}
+              </StreamRow>
             )}
             {typeof properties.temperature === "number" && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">T</span>
-                <span className="font-mono">
-                  {kelvinToCelsius(properties.temperature).toFixed(1)} °C
-                </span>
-              </div>
+              <StreamRow label="T">
+                {kelvinToCelsius(properties.temperature).toFixed(1)} °C
+              </StreamRow>
             )}
             {typeof properties.pressure === "number" && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">P</span>
-                <span className="font-mono">
-                  {(properties.pressure / 1e5).toFixed(3)} bar
-                </span>
-              </div>
+              <StreamRow label="P">{(properties.pressure / 1e5).toFixed(3)} bar</StreamRow>
             )}
             {typeof properties.mdot === "number" && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">ṁ</span>
-                <span className="font-mono">
-                  {formatNumber(properties.mdot, 4)} kg/s
-                </span>
-              </div>
+              <StreamRow label="ṁ">{formatNumber(properties.mdot, 4)} kg/s</StreamRow>
             )}
             {typeof properties.h_mass === "number" && properties.h_mass !== 0 && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">h</span>
-                <span className="font-mono">
-                  {formatNumber(properties.h_mass / 1e3)} kJ/kg
-                </span>
-              </div>
+              <StreamRow label="h">{formatNumber(properties.h_mass / 1e3)} kJ/kg</StreamRow>
             )}
             {typeof properties.density === "number" && properties.density !== 0 && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">ρ</span>
-                <span className="font-mono">
-                  {formatNumber(properties.density)} kg/m³
-                </span>
-              </div>
+              <StreamRow label="ρ">{formatNumber(properties.density)} kg/m³</StreamRow>
             )}
             {typeof properties.v_dot_normal_m3_h === "number" &&
               properties.v_dot_normal_m3_h !== 0 && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">V̇ (normal)</span>
-                <span className="font-mono">
-                  {formatNumber(properties.v_dot_normal_m3_h)} Nm³/h
-                </span>
-              </div>
+              <StreamRow label="V̇ (normal)">
+                {formatNumber(properties.v_dot_normal_m3_h)} Nm³/h
+              </StreamRow>
             )}
             {typeof properties.v_dot_real_m3_h === "number" &&
               properties.v_dot_real_m3_h !== 0 && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">V̇ (real)</span>
-                <span className="font-mono">
-                  {formatNumber(properties.v_dot_real_m3_h)} m³/h
-                </span>
-              </div>
+              <StreamRow label="V̇ (real)">
+                {formatNumber(properties.v_dot_real_m3_h)} m³/h
+              </StreamRow>
             )}
             {properties.top_Y != null &&
               typeof properties.top_Y === "object" &&
@@ -637,10 +586,7 @@ export function PropertiesPanel() {
               </div>
             )}
             {properties.upstream_stage != null && (
-              <div className="py-1 flex justify-between gap-2">
-                <span className="text-muted-foreground">From stage</span>
-                <span className="font-mono">{String(properties.upstream_stage)}</span>
-              </div>
+              <StreamRow label="From stage">{String(properties.upstream_stage)}</StreamRow>
             )}
           </div>
         </div>
@@ -9,6 +9,8 @@
  * - startSimulation is called without simulation_time/time_step in steady mode.
  * - startSimulation is called with simulation_time/time_step in transient mode.
  * - Force Run skips the cache lookup and starts a fresh simulation.
+ * - Re-running an unchanged config whose results are on screen skips both
+ *   the cache lookup and the solve.
  * - GUI actions sync YAML before fetching/running, so exports reflect GUI edits.
  */
 
@@ -89,6 +91,8 @@ vi.mock("@/stores/configStore", () => {
   return { useConfigStore };
 });
 
+const simResults = vi.hoisted(() => ({ current: null as unknown }));
+
 vi.mock("@/stores/simulationStore", () => {
   // Mirrors zustand's real call shape: `useSimulationStore()` (no selector,
   // used by SimulateCard's own destructuring) and `useSimulationStore(sel)`
@@ -99,12 +103,18 @@ vi.mock("@/stores/simulationStore", () => {
   const state = {
     isRunning: false,
     simulationId: null,
+    get results() {
+      return simResults.current;
+    },
+    resultsSimulationId: null,
     progress: null,
     pythonCode: "",
     beginSimulationRun: vi.fn(),
     startSimulation: vi.fn(),
     setError: vi.fn(),
-    setResults: vi.fn(),
+    setResults: vi.fn((results: unknown) => {
+      simResults.current = results;
+    }),
     stopped: vi.fn(),
   };
   const useSimulationStore = (selector?: (s: typeof state) => unknown) =>
@@ -119,6 +129,7 @@ vi.mock("@/stores/simulationStore", () => {
 describe("SimulateCard", () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    simResults.current = null;
     mockConfig = { nodes: [], connections: [] };
     useSolverStore.setState({
       mode: "steady",
@@ -172,6 +183,28 @@ describe("SimulateCard", () => {
     expect(mockStartSimulation).toHaveBeenCalledOnce();
   });
 
+  it("skips the cache lookup when the shown results match the unchanged config", async () => {
+    mockConfig = { nodes: [{ id: "r1", type: "IdealGasReactor", properties: {} }], connections: [] };
+    mockCheckSimulationCache.mockResolvedValueOnce({
+      cached: true,
+      result: { time: [0], reactors: {} },
+      meta: { created_at: Date.now() / 1000 },
+    });
+    const { rerender } = render(<SimulateCard />);
+    await act(async () => {
+      fireEvent.click(screen.getByRole("button", { name: /run simulation/i }));
+    });
+    rerender(<SimulateCard />);
+    await act(async () => {
+      fireEvent.click(screen.getByRole("button", { name: /run simulation/i }));
+    });
+    expect(mockCheckSimulationCache).toHaveBeenCalledOnce();
+    expect(mockStartSimulation).not.toHaveBeenCalled();
+    expect(toast.success).toHaveBeenLastCalledWith(
+      "Results are already up to date. Re-run skipped.",
+    );
+  });
+
   it("syncs YAML before fetching GUI actions on mount", async () => {
     render(<SimulateCard />);
     await act(async () => {});
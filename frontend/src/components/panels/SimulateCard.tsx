@@ -1,4 +1,4 @@
-import { useCallback, useState, useEffect } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import type { Core as CytoscapeCore } from "cytoscape";
 import { useConfigStore } from "@/stores/configStore";
 import { useSimulationStore } from "@/stores/simulationStore";
@@ -13,6 +13,7 @@ import { Button } from "@/components/ui/Button";
 import { Tooltip } from "@/components/ui/Tooltip";
 import { RunControl } from "./RunControl";
 import type { GuiActionMeta } from "@/types/guiAction";
+import type { SimulationResults } from "@/types/simulation";
 import { toast } from "sonner";
 
 //: One host action embeds a light-background capture of the live network
@@ -44,6 +45,7 @@ export function SimulateCard() {
     isRunning,
     simulationId,
     results,
+    resultsSimulationId,
     pythonCode,
     beginSimulationRun,
     startSimulation: setStarted,
@@ -66,6 +68,20 @@ export function SimulateCard() {
   // _resolve_run_grid in the backend).
   const sendTimeOverride = mode === "transient" && kind === "advance";
 
+  // Run inputs behind the results currently shown, so a repeat click on an
+  // unchanged config is answered without a cache round-trip or a solve.
+  // `pendingRunRef` holds the key of a started run until its results land.
+  const lastRunRef = useRef<{ key: string; results: SimulationResults } | null>(null);
+  const pendingRunRef = useRef<{ key: string; simulationId: string } | null>(null);
+
+  useEffect(() => {
+    const pending = pendingRunRef.current;
+    if (results && pending && resultsSimulationId === pending.simulationId) {
+      lastRunRef.current = { key: pending.key, results };
+      pendingRunRef.current = null;
+    }
+  }, [results, resultsSimulationId]);
+
   const [guiActions, setGuiActions] = useState<GuiActionMeta[]>([]);
   const [runningActionId, setRunningActionId] = useState<string | null>(null);
 
@@ -124,6 +140,21 @@ export function SimulateCard() {
       return;
     }
 
+    const runKey = JSON.stringify([
+      config,
+      sendTimeOverride ? simTime : null,
+      sendTimeOverride ? timeStep : null,
+    ]);
+    if (
+      !force &&
+      results &&
+      lastRunRef.current?.key === runKey &&
+      lastRunRef.current.results === results
+    ) {
+      toast.success("Results are already up to date. Re-run skipped.");
+      return;
+    }
+
     // Check whether a cached result already exists for the current config.
     // This avoids re-running the full simulation when nothing has changed.
     // Transient runs pass their time/step overrides so the server-side
@@ -144,6 +175,7 @@ export function SimulateCard() {
         );
         if (cacheResp.cached) {
           setResults(cacheResp.result);
+          lastRunRef.current = { key: runKey, results: cacheResp.result };
           const created = cacheResp.meta.created_at;
           const ageMin = Math.round((Date.now() / 1000 - created) / 60);
           const ageStr = ageMin < 2 ? "just now" : `${ageMin} min ago`;
@@ -163,12 +195,13 @@ export function SimulateCard() {
         sendTimeOverride ? parseFloat(timeStep) : undefined,
       );
       setStarted(resp.simulation_id);
+      pendingRunRef.current = { key: runKey, simulationId: resp.simulation_id };
     } catch (err) {
       const msg = err instanceof Error ? err.message : String(err);
       toast.error(`Failed: ${msg}`);
       setError(msg);
     }
-  }, [config, simTime, timeStep, sendTimeOverride, beginSimulationRun, setStarted, setError, setResults]);
+  }, [config, simTime, timeStep, sendTimeOverride, results, beginSimulationRun, setStarted, setError, setResults]);
 
   const handleStop = useCallback(() => {
     if (!simulationId) return;
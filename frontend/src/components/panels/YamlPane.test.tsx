@@ -5,7 +5,8 @@
  * closing confirms only when there's something to lose. Also covers the
  * live one-way refresh: a config change made elsewhere (e.g. adding a
  * reactor) updates the displayed YAML automatically, but never while the
- * user has an unsaved edit sitting in the editor.
+ * user has an unsaved edit sitting in the editor, and a burst of such
+ * changes costs a single re-sync.
  */
 
 import { describe, it, expect, vi, beforeEach } from "vitest";
@@ -306,6 +307,24 @@ describe("YamlPane", () => {
     );
   });
 
+  it("coalesces a burst of config changes into a single re-sync", async () => {
+    const { rerender } = render(<YamlPane />);
+    const editor = await editorValue();
+    await waitFor(() => expect(editor).toHaveValue("merged: yaml\n"));
+    expect(mockSyncConfig).toHaveBeenCalledOnce();
+
+    for (const id of ["r2", "r3", "r4"]) {
+      mockConfig = { nodes: [{ id, type: "Reservoir", properties: {} }], connections: [] };
+      rerender(<YamlPane />);
+    }
+
+    await waitFor(() => expect(mockSyncConfig).toHaveBeenCalledTimes(2));
+    // Only the last config of the burst is merged.
+    expect(mockSyncConfig.mock.calls[1][0]).toEqual(mockConfig);
+    await new Promise((r) => setTimeout(r, 300));
+    expect(mockSyncConfig).toHaveBeenCalledTimes(2);
+  });
+
   it("does not clobber an unsaved edit when the config changes elsewhere", async () => {
     const { rerender } = render(<YamlPane />);
     const editor = await editorValue();
@@ -12,6 +12,14 @@ import { toast } from "sonner";
 
 const MonacoEditor = lazy(() => import("@monaco-editor/react"));
 
+/**
+ * Quiet period before a config change elsewhere re-syncs the displayed YAML.
+ * Each sync is a /configs/sync round-trip; edits tend to arrive in bursts
+ * (typing in a property field, a run's post-build node update, a scenario
+ * switch), and only the last config of a burst is worth merging.
+ */
+const CONFIG_SYNC_DEBOUNCE_MS = 150;
+
 /**
  * Full-height pane (replaces the old YAML modal) docked right of the
  * Scenario pane, so the YAML can be edited alongside the graph instead of
@@ -45,6 +53,7 @@ export function YamlPane() {
   const isDirtyRef = useRef(isDirty);
   isDirtyRef.current = isDirty;
   const justSavedRef = useRef(false);
+  const openedRef = useRef(false);
 
   const refresh = useCallback(() => {
     setSyncError(null);
@@ -85,14 +94,25 @@ export function YamlPane() {
   // Refresh on open, and whenever the config changes elsewhere (add/edit a
   // node, etc.) — but never while there's an unsaved edit sitting in the
   // editor, and not immediately after our own Save (which already set
-  // `baseline` to exactly what's on disk, no round-trip needed).
+  // `baseline` to exactly what's on disk, no round-trip needed). Opening
+  // syncs at once; later changes are debounced so a burst of edits costs
+  // one round-trip.
   useEffect(() => {
     if (justSavedRef.current) {
       justSavedRef.current = false;
       return;
     }
     if (isDirtyRef.current) return;
-    refresh();
+    if (!openedRef.current) {
+      openedRef.current = true;
+      refresh();
+      return;
+    }
+    const t = setTimeout(() => {
+      // The user may have started typing during the quiet period.
+      if (!isDirtyRef.current) refresh();
+    }, CONFIG_SYNC_DEBOUNCE_MS);
+    return () => clearTimeout(t);
   }, [refresh]);
 
   const handleSave = useCallback(async () => {
@@ -1,6 +1,7 @@
 import { useMemo } from "react";
 import Plot from "react-plotly.js";
-import { coerceNumericSeries, pressureYAxis } from "@/lib/plotAxis";
+import { rankMainSpecies } from "@/lib/mainSpecies";
+import { coerceNumericSeries, LINE_TRACE_TYPE, pressureYAxis } from "@/lib/plotAxis";
 import { useSelectionStore } from "@/stores/selectionStore";
 import { useThemeStore } from "@/stores/themeStore";
 import type { NodeConservation, SimulationProgress } from "@/types/simulation";
@@ -79,32 +80,13 @@ export function ConvergenceTab({ data }: Props) {
     [theme],
   );
 
-  const MAIN_SPECIES_MIN_FRACTION = 1e-4;
-  const MAIN_SPECIES_MAX_COUNT = 12;
-
   const series = selectedReactorId
     ? data.reactors_series[selectedReactorId]
     : undefined;
 
-  const mainSpeciesMole = useMemo(() => {
-    const X = series?.X ?? {};
-    return Object.entries(X)
-      .map(([name, arr]) => ({ name, max: Math.max(...(arr ?? []), 0) }))
-      .filter((s) => s.max >= MAIN_SPECIES_MIN_FRACTION)
-      .sort((a, b) => b.max - a.max)
-      .slice(0, MAIN_SPECIES_MAX_COUNT)
-      .map((s) => s.name);
-  }, [series?.X]);
+  const mainSpeciesMole = useMemo(() => rankMainSpecies(series?.X), [series?.X]);
 
-  const mainSpeciesMass = useMemo(() => {
-    const Y = series?.Y ?? {};
-    return Object.entries(Y)
-      .map(([name, arr]) => ({ name, max: Math.max(...(arr ?? []), 0) }))
-      .filter((s) => s.max >= MAIN_SPECIES_MIN_FRACTION)
-      .sort((a, b) => b.max - a.max)
-      .slice(0, MAIN_SPECIES_MAX_COUNT)
-      .map((s) => s.name);
-  }, [series?.Y]);
+  const mainSpeciesMass = useMemo(() => rankMainSpecies(series?.Y), [series?.Y]);
 
   if (!data.times.length && !series?.is_spatial && !series?.is_residence) {
     return <p className="text-sm text-muted-foreground">No data yet.</p>;
@@ -200,7 +182,7 @@ export function ConvergenceTab({ data }: Props) {
     const moleFractionTraces = mainSpeciesMole.map((sp) => ({
       x: times,
       y: series.X?.[sp] ?? [],
-      type: "scatter" as const,
+      type: LINE_TRACE_TYPE,
       mode: "lines" as const,
       name: sp,
       line: { width: 2 },
@@ -209,7 +191,7 @@ export function ConvergenceTab({ data }: Props) {
     const massFractionTraces = mainSpeciesMass.map((sp) => ({
       x: times,
       y: series.Y?.[sp] ?? [],
-      type: "scatter" as const,
+      type: LINE_TRACE_TYPE,
       mode: "lines" as const,
       name: sp,
       line: { width: 2 },
@@ -228,7 +210,7 @@ export function ConvergenceTab({ data }: Props) {
             {
               x: times,
               y: series.T?.map((t) => t - 273.15) ?? [],
-              type: "scatter",
+              type: LINE_TRACE_TYPE,
               mode: "lines",
               name: selectedReactorId,
               line: { width: 2 },
@@ -251,7 +233,7 @@ export function ConvergenceTab({ data }: Props) {
             {
               x: times,
               y: coerceNumericSeries(series.P),
-              type: "scatter",
+              type: LINE_TRACE_TYPE,
               mode: "lines",
               name: selectedReactorId,
               line: { width: 2 },
@@ -366,7 +348,7 @@ export function ConvergenceTab({ data }: Props) {
               // Log time axis: drop t = 0 so the ns-to-ms span stays legible.
               x: times.map((t) => (t > 0 ? t : null)),
               y: series.T ?? [],
-              type: "scatter",
+              type: LINE_TRACE_TYPE,
               mode: "lines",
               name: selectedReactorId ?? "T",
               line: { width: 2 },
@@ -3,6 +3,9 @@
  *
  * Asserts:
  * - Single-sample steady results are rendered with visible markers.
+ * - Re-rendering with the same series reuses every trace list and the
+ *   line-plot layouts.
+ * - Temperature, pressure and species curves are WebGL (scattergl) traces.
  */
 
 import { render } from "@testing-library/react";
@@ -14,6 +17,7 @@ import type { SimulationProgress } from "@/types/simulation";
 import { PlotsTab } from "./PlotsTab";
 
 interface PlotTrace {
+  type?: string;
   mode?: string;
   x?: number[];
   y?: number[];
@@ -107,6 +111,27 @@ describe("PlotsTab", () => {
     });
   });
 
+  it("reuses converted series and species traces across re-renders", () => {
+    const { rerender } = render(<PlotsTab data={steadySingleSample} />);
+    const [firstTemperature, firstPressure, firstSpecies] = plotCalls;
+    plotCalls.length = 0;
+    rerender(<PlotsTab data={steadySingleSample} />);
+
+    expect(plotCalls[0].data).toBe(firstTemperature.data);
+    expect(plotCalls[1].data).toBe(firstPressure.data);
+    expect(plotCalls[2].data).toBe(firstSpecies.data);
+    expect(plotCalls[0].layout).toBe(firstTemperature.layout);
+    expect(plotCalls[2].layout).toBe(firstSpecies.layout);
+  });
+
+  it("draws every line trace with WebGL", () => {
+    render(<PlotsTab data={steadySingleSample} />);
+
+    const types = plotCalls.flatMap((plot) => plot.data.map((trace) => trace.type));
+    expect(types.length).toBeGreaterThan(2);
+    expect(new Set(types)).toEqual(new Set(["scattergl"]));
+  });
+
   it("uses a zero baseline for spatial pressure profiles", () => {
     useSelectionStore.setState({
       selectedElement: { type: "node", data: { id: "pfr" } },
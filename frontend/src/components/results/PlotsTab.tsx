@@ -1,7 +1,9 @@
 import { useCallback, useMemo, useState } from "react";
 import Plot from "react-plotly.js";
 import { useSpeciesColors } from "@/hooks/useSpeciesColors";
-import { coerceNumericSeries, pressureYAxis } from "@/lib/plotAxis";
+import { lttb } from "@/lib/lttb";
+import { rankMainSpecies } from "@/lib/mainSpecies";
+import { coerceNumericSeries, LINE_TRACE_TYPE, pressureYAxis } from "@/lib/plotAxis";
 import { getSpeciesColor } from "@/lib/speciesColor";
 import { useConfigStore } from "@/stores/configStore";
 import { useSelectionStore } from "@/stores/selectionStore";
@@ -24,10 +26,37 @@ interface Props {
   data: SimulationProgress;
 }
 
+const PLOT_CONFIG = { responsive: true, displayModeBar: false };
+
 function traceModeForSamples(sampleCount: number): "lines" | "lines+markers" {
   return sampleCount > 1 ? "lines" : "lines+markers";
 }
 
+/**
+ * One line trace per species, colored by the plugin palette / theme
+ * colorway and downsampled with LTTB. Built inside a `useMemo` so
+ * re-renders that only touch the shared x-range reuse the same trace
+ * objects.
+ */
+function speciesTraces(
+  species: string[],
+  fractions: Record<string, number[]> | undefined,
+  xAxis: number[],
+  theme: "light" | "dark",
+  speciesColors: Record<string, string>,
+  hideSpecies: Set<string>,
+) {
+  const mode = traceModeForSamples(xAxis.length);
+  return species.map((name, i) => ({
+    ...lttb(xAxis, fractions?.[name] ?? []),
+    type: LINE_TRACE_TYPE,
+    mode,
+    name,
+    line: { width: 2, color: getSpeciesColor(name, theme, i, speciesColors) },
+    visible: traceVisibility(name, hideSpecies),
+  }));
+}
+
 export function PlotsTab({ data }: Props) {
   const selectedElement = useSelectionStore((s) => s.selectedElement);
   const theme = useThemeStore((s) => s.theme);
@@ -51,9 +80,6 @@ export function PlotsTab({ data }: Props) {
       setXRange([Number(r[0]), Number(r[1])]);
     }
   }, []);
-  const xRangeProps = xRange
-    ? { range: [xRange[0], xRange[1]], autorange: false as const }
-    : {};
 
   // Determine which reactor to plot (selected only)
   const selectedReactorId = useMemo(() => {
@@ -81,10 +107,23 @@ export function PlotsTab({ data }: Props) {
     ? data.reactors_series[selectedReactorId]
     : undefined;
 
+  // Unit conversions depend only on the series, not on the theme or the
+  // shared x-range: keeping these arrays referentially stable lets
+  // Plotly.react treat a theme toggle or zoom as a relayout instead of
+  // recomputing every trace.
+  const temperatureC = useMemo(
+    () => reactorSeries?.T?.map((t: number) => t - 273.15) ?? [],
+    [reactorSeries?.T],
+  );
+  const pressureSeries = useMemo(
+    () => coerceNumericSeries(reactorSeries?.P),
+    [reactorSeries?.P],
+  );
+
   // Per-node `plot_options: {hide_species, show_species}` (STONE node
   // property) lets an example author hide dominant/uninteresting species
   // (e.g. N2, O2) and force minor-but-relevant ones (e.g. reaction
-  // intermediates that never crack the top-12-by-magnitude heuristic below)
+  // intermediates that never crack the top-12-by-magnitude `rankMainSpecies`)
   // into the chart by default -- the user can still click a hidden trace's
   // legend entry to reveal it.
   const plotConfig: NodePlotConfig = useMemo(() => {
@@ -101,20 +140,9 @@ export function PlotsTab({ data }: Props) {
     };
   }, [configNodes, selectedReactorId]);
 
-  const MAIN_SPECIES_MIN_FRACTION = 1e-4;
-  const MAIN_SPECIES_MAX_COUNT = 12;
-
   const mainSpeciesMole = useMemo(() => {
     const X = reactorSeries?.X ?? {};
-    const ranked = Object.entries(X)
-      .map(([name, arr]) => ({
-        name,
-        max: Math.max(...(arr ?? []), 0),
-      }))
-      .filter((s) => s.max >= MAIN_SPECIES_MIN_FRACTION)
-      .sort((a, b) => b.max - a.max)
-      .slice(0, MAIN_SPECIES_MAX_COUNT)
-      .map((s) => s.name);
+    const ranked = rankMainSpecies(X);
     const forced = plotConfig.showSpecies.filter(
       (name) => name in X && !ranked.includes(name),
     );
@@ -123,21 +151,129 @@ export function PlotsTab({ data }: Props) {
 
   const mainSpeciesMass = useMemo(() => {
     const Y = reactorSeries?.Y ?? {};
-    const ranked = Object.entries(Y)
-      .map(([name, arr]) => ({
-        name,
-        max: Math.max(...(arr ?? []), 0),
-      }))
-      .filter((s) => s.max >= MAIN_SPECIES_MIN_FRACTION)
-      .sort((a, b) => b.max - a.max)
-      .slice(0, MAIN_SPECIES_MAX_COUNT)
-      .map((s) => s.name);
+    const ranked = rankMainSpecies(Y);
     const forced = plotConfig.showSpecies.filter(
       (name) => name in Y && !ranked.includes(name),
     );
     return [...ranked, ...forced];
   }, [reactorSeries?.Y, plotConfig.showSpecies]);
 
+  // Axial / residence-time profiles plot against their own coordinate;
+  // everything else against the shared simulation clock.
+  const speciesXAxis = useMemo(() => {
+    if (reactorSeries?.is_residence) return reactorSeries.t ?? [];
+    if (reactorSeries?.is_spatial) return reactorSeries.x ?? [];
+    return data.times;
+  }, [reactorSeries, data.times]);
+
+  const temperaturePoints = useMemo(
+    () => lttb(speciesXAxis, temperatureC),
+    [speciesXAxis, temperatureC],
+  );
+  const pressurePoints = useMemo(
+    () => lttb(speciesXAxis, pressureSeries),
+    [speciesXAxis, pressureSeries],
+  );
+
+  // Single-trace lists for the temperature and pressure plots, built as
+  // plain literals once per series so Plotly receives stable `data` props.
+  const temperatureTraces = useMemo(
+    () => [
+      {
+        ...temperaturePoints,
+        type: LINE_TRACE_TYPE,
+        mode: traceModeForSamples(speciesXAxis.length),
+        name: selectedReactorId ?? undefined,
+        line: { width: 2 },
+      },
+    ],
+    [temperaturePoints, speciesXAxis.length, selectedReactorId],
+  );
+  const pressureTraces = useMemo(
+    () => [
+      {
+        ...pressurePoints,
+        type: LINE_TRACE_TYPE,
+        mode: traceModeForSamples(speciesXAxis.length),
+        name: selectedReactorId ?? undefined,
+        line: { width: 2 },
+      },
+    ],
+    [pressurePoints, speciesXAxis.length, selectedReactorId],
+  );
+
+  const moleFractionTraces = useMemo(
+    () =>
+      speciesTraces(
+        mainSpeciesMole,
+        reactorSeries?.X,
+        speciesXAxis,
+        theme,
+        speciesColors,
+        plotConfig.hideSpecies,
+      ),
+    [mainSpeciesMole, reactorSeries?.X, speciesXAxis, theme, speciesColors, plotConfig],
+  );
+
+  const massFractionTraces = useMemo(
+    () =>
+      speciesTraces(
+        mainSpeciesMass,
+        reactorSeries?.Y,
+        speciesXAxis,
+        theme,
+        speciesColors,
+        plotConfig.hideSpecies,
+      ),
+    [mainSpeciesMass, reactorSeries?.Y, speciesXAxis, theme, speciesColors, plotConfig],
+  );
+
+  // Line-plot layouts are built in one pass per theme, x-range or
+  // coordinate change. Re-renders that touch none of these hand Plotly the
+  // same layout objects, and react-plotly then skips Plotly.react.
+  const isResidence = Boolean(reactorSeries?.is_residence);
+  const isSpatial = Boolean(reactorSeries?.is_spatial);
+  const lineLayouts = useMemo(() => {
+    const gridcolor = theme === "dark" ? "#333" : "#e0e0e0";
+    const xLabel = isResidence
+      ? "Residence time (s)"
+      : isSpatial
+        ? "Position (m)"
+        : "Time (s)";
+    const coordLabel = isResidence ? "Residence time" : isSpatial ? "Position" : "Time";
+    const xaxis = {
+      title: { text: xLabel, font: { size: 12 } },
+      gridcolor,
+      ...(xRange ? { range: [xRange[0], xRange[1]], autorange: false as const } : {}),
+    };
+    const layout = (title: string, yaxis: Partial<Plotly.LayoutAxis>) => ({
+      ...layoutDefaults,
+      title: { text: title, font: { size: 14 } },
+      xaxis,
+      yaxis,
+    });
+    const fractionAxis = (text: string) => ({
+      title: { text, font: { size: 12 } },
+      gridcolor,
+      tickformat: ".2e",
+    });
+    return {
+      temperature: layout(`Temperature vs ${coordLabel}`, {
+        title: { text: "Temperature (°C)", font: { size: 12 } },
+        gridcolor,
+      }),
+      pressure: layout(`Pressure vs ${coordLabel}`, pressureYAxis(gridcolor)),
+      mole: layout(
+        `Mole fraction vs ${coordLabel} (main species)`,
+        fractionAxis("Mole fraction"),
+      ),
+      mass: layout(
+        `Mass fraction vs ${coordLabel} (main species)`,
+        fractionAxis("Mass fraction"),
+      ),
+    };
+  }, [layoutDefaults, theme, xRange, isResidence, isSpatial]);
+
   if (!data.times.length && !reactorSeries?.is_spatial && !reactorSeries?.is_residence) {
     return <p className="text-sm text-muted-foreground">No data yet.</p>;
   }
@@ -150,149 +286,10 @@ export function PlotsTab({ data }: Props) {
     );
   }
 
-  const gridcolor = theme === "dark" ? "#333" : "#e0e0e0";
-
-  // --- Axial (PFR) or residence-time (closed CSTR / torch) profiles ---
-  if (reactorSeries?.is_spatial || reactorSeries?.is_residence) {
-    const isResidence = Boolean(reactorSeries?.is_residence);
-    const xAxis = isResidence
-      ? (reactorSeries.t ?? [])
-      : (reactorSeries.x ?? []);
-    const xLabel = isResidence ? "Residence time (s)" : "Position (m)";
-    const coordLabel = isResidence ? "Residence time" : "Position";
-    const profileTraceMode = traceModeForSamples(xAxis.length);
-
-    const moleFractionTraces = mainSpeciesMole.map((species, i) => ({
-      x: xAxis,
-      y: reactorSeries.X?.[species] ?? [],
-      type: "scatter" as const,
-      mode: profileTraceMode,
-      name: species,
-      line: { width: 2, color: getSpeciesColor(species, theme, i, speciesColors) },
-      visible: traceVisibility(species, plotConfig.hideSpecies),
-    }));
-
-    const massFractionTraces = mainSpeciesMass.map((species, i) => ({
-      x: xAxis,
-      y: reactorSeries.Y?.[species] ?? [],
-      type: "scatter" as const,
-      mode: profileTraceMode,
-      name: species,
-      line: { width: 2, color: getSpeciesColor(species, theme, i, speciesColors) },
-      visible: traceVisibility(species, plotConfig.hideSpecies),
-    }));
-
-    return (
-      <div className="space-y-4">
-        {/* Temperature vs Position */}
-        <div>
-          <Plot
-            data={[
-              {
-                x: xAxis,
-                y: reactorSeries.T?.map((t) => t - 273.15) ?? [],
-                type: "scatter",
-                mode: profileTraceMode,
-                name: selectedReactorId,
-                line: { width: 2 },
-              },
-            ]}
-            layout={{
-              ...layoutDefaults,
-              title: { text: `Temperature vs ${coordLabel}`, font: { size: 14 } },
-              xaxis: { title: { text: xLabel, font: { size: 12 } }, gridcolor, ...xRangeProps },
-              yaxis: { title: { text: "Temperature (°C)", font: { size: 12 } }, gridcolor },
-            }}
-            config={{ responsive: true, displayModeBar: false }}
-            onRelayout={syncXRelayout}
-            useResizeHandler
-            className="w-full"
-          />
-        </div>
-
-        {/* Pressure vs Position */}
-        <div>
-          <Plot
-            data={[
-              {
-                x: xAxis,
-                y: coerceNumericSeries(reactorSeries.P),
-                type: "scatter",
-                mode: profileTraceMode,
-                name: selectedReactorId,
-                line: { width: 2 },
-              },
-            ]}
-            layout={{
-              ...layoutDefaults,
-              title: { text: `Pressure vs ${coordLabel}`, font: { size: 14 } },
-              xaxis: { title: { text: xLabel, font: { size: 12 } }, gridcolor, ...xRangeProps },
-              yaxis: pressureYAxis(gridcolor),
-            }}
-            config={{ responsive: true, displayModeBar: false }}
-            onRelayout={syncXRelayout}
-            useResizeHandler
-            className="w-full"
-          />
-        </div>
-
-        {/* Mole fractions vs Position */}
-        {moleFractionTraces.length > 0 && (
-          <div>
-            <Plot
-              data={moleFractionTraces}
-              layout={{
-                ...layoutDefaults,
-                title: {
-                  text: `Mole fraction vs ${coordLabel} (main species)`,
-                  font: { size: 14 },
-                },
-                xaxis: { title: { text: xLabel, font: { size: 12 } }, gridcolor, ...xRangeProps },
-                yaxis: {
-                  title: { text: "Mole fraction", font: { size: 12 } },
-                  gridcolor,
-                  tickformat: ".2e",
-                },
-              }}
-              config={{ responsive: true, displayModeBar: false }}
-              onRelayout={syncXRelayout}
-              useResizeHandler
-              className="w-full"
-            />
-          </div>
-        )}
-
-        {/* Mass fractions vs Position */}
-        {massFractionTraces.length > 0 && (
-          <div>
-            <Plot
-              data={massFractionTraces}
-              layout={{
-                ...layoutDefaults,
-                title: {
-                  text: `Mass fraction vs ${coordLabel} (main species)`,
-                  font: { size: 14 },
-                },
-                xaxis: { title: { text: xLabel, font: { size: 12 } }, gridcolor, ...xRangeProps },
-                yaxis: {
-                  title: { text: "Mass fraction", font: { size: 12 } },
-                  gridcolor,
-                  tickformat: ".2e",
-                },
-              }}
-              config={{ responsive: true, displayModeBar: false }}
-              onRelayout={syncXRelayout}
-              useResizeHandler
-              className="w-full"
-            />
-          </div>
-        )}
-      </div>
-    );
-  }
+  const isProfile = isSpatial || isResidence;
 
   // --- PSR: steady-state composition pie charts ---
-  if (reactorSeries?.is_psr) {
+  if (reactorSeries?.is_psr && !isProfile) {
     // Last point in each array is the converged steady-state
     const lastMole = Object.fromEntries(
       Object.entries(reactorSeries.X ?? {}).map(([sp, arr]) => [
@@ -363,7 +360,7 @@ export function PlotsTab({ data }: Props) {
               title: { text: "Mole fractions (steady state)", font: { size: 14 } },
               showlegend: false,
             }}
-            config={{ responsive: true, displayModeBar: false }}
+            config={PLOT_CONFIG}
             onRelayout={syncXRelayout}
             useResizeHandler
             className="w-full"
@@ -393,7 +390,7 @@ export function PlotsTab({ data }: Props) {
               title: { text: "Mass fractions (steady state)", font: { size: 14 } },
               showlegend: false,
             }}
-            config={{ responsive: true, displayModeBar: false }}
+            config={PLOT_CONFIG}
             onRelayout={syncXRelayout}
             useResizeHandler
             className="w-full"
@@ -403,155 +400,38 @@ export function PlotsTab({ data }: Props) {
     );
   }
 
-  // --- Default: standard time-series plots ---
-  const times = data.times;
-  const timeTraceMode = traceModeForSamples(times.length);
-
-  const moleFractionTraces = mainSpeciesMole.map((species, i) => ({
-    x: times,
-    y: reactorSeries?.X?.[species] ?? [],
-    type: "scatter" as const,
-    mode: timeTraceMode,
-    name: species,
-    line: { width: 2, color: getSpeciesColor(species, theme, i, speciesColors) },
-    visible: traceVisibility(species, plotConfig.hideSpecies),
-  }));
-
-  const massFractionTraces = mainSpeciesMass.map((species, i) => ({
-    x: times,
-    y: reactorSeries?.Y?.[species] ?? [],
-    type: "scatter" as const,
-    mode: timeTraceMode,
-    name: species,
-    line: { width: 2, color: getSpeciesColor(species, theme, i, speciesColors) },
-    visible: traceVisibility(species, plotConfig.hideSpecies),
-  }));
+  // --- Line plots: time series, or axial (PFR) / residence-time (closed
+  // CSTR / torch) profiles against their own coordinate ---
+  const linePlot = (traces: Plotly.Data[], layout: Partial<Plotly.Layout>) => (
+    <Plot
+      data={traces}
+      layout={layout}
+      config={PLOT_CONFIG}
+      onRelayout={syncXRelayout}
+      useResizeHandler
+      className="w-full"
+    />
+  );
 
   return (
     <div className="space-y-4">
-      {/* Temperature plot */}
-      <div id="temperature-plot-container">
-        <Plot
-          data={[
-            {
-              x: data.times,
-              y:
-                data.reactors_series[selectedReactorId]?.T?.map(
-                  (t: number) => t - 273.15,
-                ) ?? [],
-              type: "scatter" as const,
-              mode: timeTraceMode,
-              name: selectedReactorId,
-              line: { width: 2 },
-            },
-          ]}
-          layout={{
-            ...layoutDefaults,
-            title: { text: "Temperature vs Time", font: { size: 14 } },
-            xaxis: {
-              title: { text: "Time (s)", font: { size: 12 } },
-              gridcolor,
-              ...xRangeProps,
-            },
-            yaxis: {
-              title: { text: "Temperature (°C)", font: { size: 12 } },
-              gridcolor,
-            },
-          }}
-          config={{ responsive: true, displayModeBar: false }}
-          onRelayout={syncXRelayout}
-          useResizeHandler
-          className="w-full"
-        />
+      <div id={isProfile ? undefined : "temperature-plot-container"}>
+        {linePlot(temperatureTraces, lineLayouts.temperature)}
       </div>
 
-      {/* Pressure plot */}
       <div>
-        <Plot
-          data={[
-            {
-              x: data.times,
-              y: coerceNumericSeries(data.reactors_series[selectedReactorId]?.P),
-              type: "scatter" as const,
-              mode: timeTraceMode,
-              name: selectedReactorId,
-              line: { width: 2 },
-            },
-          ]}
-          layout={{
-            ...layoutDefaults,
-            title: { text: "Pressure vs Time", font: { size: 14 } },
-            xaxis: {
-              title: { text: "Time (s)", font: { size: 12 } },
-              gridcolor,
-              ...xRangeProps,
-            },
-            yaxis: pressureYAxis(gridcolor),
-          }}
-          config={{ responsive: true, displayModeBar: false }}
-          onRelayout={syncXRelayout}
-          useResizeHandler
-          className="w-full"
-        />
+        {linePlot(pressureTraces, lineLayouts.pressure)}
       </div>
 
-      {/* Mole fraction (composition) vs Time */}
       {moleFractionTraces.length > 0 && (
         <div>
-          <Plot
-            data={moleFractionTraces}
-            layout={{
-              ...layoutDefaults,
-              title: {
-                text: "Mole fraction vs Time (main species)",
-                font: { size: 14 },
-              },
-              xaxis: {
-                title: { text: "Time (s)", font: { size: 12 } },
-                gridcolor,
-                ...xRangeProps,
-              },
-              yaxis: {
-                title: { text: "Mole fraction", font: { size: 12 } },
-                gridcolor,
-                tickformat: ".2e",
-              },
-            }}
-            config={{ responsive: true, displayModeBar: false }}
-            onRelayout={syncXRelayout}
-            useResizeHandler
-            className="w-full"
-          />
+          {linePlot(moleFractionTraces, lineLayouts.mole)}
         </div>
       )}
 
-      {/* Mass fraction (composition) vs Time */}
-      {massFractionTraces.length > 0 && reactorSeries?.Y && (
+      {massFractionTraces.length > 0 && (
         <div>
-          <Plot
-            data={massFractionTraces}
-            layout={{
-              ...layoutDefaults,
-              title: {
-                text: "Mass fraction vs Time (main species)",
-                font: { size: 14 },
-              },
-              xaxis: {
-                title: { text: "Time (s)", font: { size: 12 } },
-                gridcolor,
-                ...xRangeProps,
-              },
-              yaxis: {
-                title: { text: "Mass fraction", font: { size: 12 } },
-                gridcolor,
-                tickformat: ".2e",
-              },
-            }}
-            config={{ responsive: true, displayModeBar: false }}
-            onRelayout={syncXRelayout}
-            useResizeHandler
-            className="w-full"
-          />
+          {linePlot(massFractionTraces, lineLayouts.mass)}
         </div>
       )}
     </div>
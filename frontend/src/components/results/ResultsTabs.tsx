@@ -29,6 +29,7 @@ type Tab = (typeof BASE_TABS)[number] | typeof ERROR_TAB_LABEL | string;
 
 export function ResultsTabs() {
   const results = useSimulationStore((s) => s.results);
+  const resultsSimulationId = useSimulationStore((s) => s.resultsSimulationId);
   const progress = useSimulationStore((s) => s.progress);
   const isRunning = useSimulationStore((s) => s.isRunning);
   const error = useSimulationStore((s) => s.error);
@@ -163,12 +164,31 @@ export function ResultsTabs() {
     fetchedKeyRef.current[pluginId] = cacheKey;
     setPluginLoading((prev) => ({ ...prev, [pluginId]: true }));
 
-    renderPlugin(pluginId, {
-      simulation_data: results as Record<string, unknown> | null,
+    const context = {
       selected_element: selectedElement as Record<string, unknown> | null,
       config: config as unknown as Record<string, unknown> | null,
       theme,
-    })
+    };
+    const renderWithData = () =>
+      renderPlugin(pluginId, {
+        ...context,
+        simulation_data: results as Record<string, unknown> | null,
+      });
+    // Streamed-in results are referenced by id; only when the server has
+    // already dropped them (a 404) do the full results go back up; any
+    // other failure is reported below, once.
+    const request = resultsSimulationId
+      ? renderPlugin(pluginId, { ...context, simulation_id: resultsSimulationId }).catch(
+          (err) => {
+            if (err instanceof Error && err.message.startsWith("API 404")) {
+              return renderWithData();
+            }
+            throw err;
+          },
+        )
+      : renderWithData();
+
+    request
       .then((data) => {
         setPluginData((prev) => ({ ...prev, [pluginId]: data }));
       })
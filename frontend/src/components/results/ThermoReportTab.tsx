@@ -1,5 +1,5 @@
 import { useSelectionStore } from "@/stores/selectionStore";
-import { useConfigStore } from "@/stores/configStore";
+import { findById, useConfigStore } from "@/stores/configStore";
 import { kelvinToCelsius, formatNumber } from "@/lib/units";
 import type { SimulationResults } from "@/types/simulation";
 
@@ -20,7 +20,7 @@ export function ThermoReportTab({ results }: Props) {
     const mfcId = String(selectedElement.data.id);
     const sourceId = String(selectedElement.data.source);
     const targetId = String(selectedElement.data.target);
-    const connection = config.connections.find((c) => c.id === mfcId);
+    const connection = findById(config.connections, mfcId);
     const props = (connection?.properties ?? {}) as Record<string, unknown>;
     const connectionReport = results.connection_reports?.[mfcId];
     const massFlowRate =
@@ -0,0 +1,42 @@
+import type { KindInfo } from "@/api/kinds";
+import { cn } from "@/lib/cn";
+import { Tooltip } from "@/components/ui/Tooltip";
+
+interface KindDocTooltipProps {
+  /** The kind's registry entry; nothing renders without a doc link. */
+  doc: KindInfo | undefined;
+  /** Kind name, for the trigger's accessible label. */
+  kind: string;
+  /** Smaller trigger, for inline use next to a caption. */
+  compact?: boolean;
+}
+
+/**
+ * "ⓘ" trigger showing a reactor/connection kind's description and Cantera doc
+ * link — shared by the add modals' type pickers and the properties header.
+ */
+export function KindDocTooltip({ doc, kind, compact = false }: KindDocTooltipProps) {
+  if (!doc?.doc_url) return null;
+  return (
+    <Tooltip
+      content={
+        <span className="block space-y-1">
+          {doc.description && <span className="block">{doc.description}</span>}
+          <a href={doc.doc_url} target="_blank" rel="noreferrer" className="underline text-primary">
+            Docs
+          </a>
+        </span>
+      }
+    >
+      <span
+        className={cn(
+          "flex shrink-0 items-center justify-center rounded-full text-muted-foreground cursor-help",
+          compact ? "h-4 w-4 text-[10px]" : "h-6 w-6",
+        )}
+        aria-label={`About ${kind}`}
+      >
+        ⓘ
+      </span>
+    </Tooltip>
+  );
+}
@@ -47,7 +47,7 @@ export function useSimulationSSE() {
     source.addEventListener("complete", (e: MessageEvent) => {
       try {
         const data = JSON.parse(e.data) as SimulationResults;
-        setResults(data);
+        setResults(data, simulationId);
 
         const failingNodes = conservationFailingNodes(data);
         if (failingNodes.length > 0) {
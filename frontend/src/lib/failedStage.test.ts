@@ -0,0 +1,25 @@
+/**
+ * Unit tests for the failed-run badge helpers.
+ *
+ * Asserts:
+ * - The failed stage is the first declared stage not yet completed.
+ * - Member nodes of that stage get the error badge; the stage box itself,
+ *   which also carries `stage`, stays unbadged.
+ */
+
+import { describe, expect, it } from "vitest";
+import { failedRunStatus, findFailedStageId } from "./failedStage";
+
+describe("failedStage", () => {
+  it("picks the first declared stage that did not complete", () => {
+    expect(findFailedStageId(["a", "b", "c"], ["a"])).toBe("b");
+    expect(findFailedStageId(["a"], ["a"])).toBeUndefined();
+  });
+
+  it("badges member nodes of the failed stage but not its box", () => {
+    expect(failedRunStatus({ stage: "b" }, "b")).toBe("error");
+    expect(failedRunStatus({ stage: "a" }, "b")).toBeNull();
+    expect(failedRunStatus({}, "b")).toBeNull();
+    expect(failedRunStatus({ stage: "b", isGroup: true }, "b")).toBeNull();
+  });
+});
@@ -0,0 +1,27 @@
+/** Which graph nodes carry the error badge after a failed run. */
+
+/**
+ * The stage that was running when a run failed: stages solve strictly
+ * sequentially, so it is the first one (in `config.groups` declaration
+ * order) missing from `completedStageIds`.
+ */
+export function findFailedStageId(
+  groupIds: readonly string[],
+  completedStageIds: readonly string[],
+): string | undefined {
+  const completed = new Set(completedStageIds);
+  return groupIds.find((id) => !completed.has(id));
+}
+
+/**
+ * Badge for one graph node after a failed run: `"error"` on the member
+ * nodes of the failed stage, nothing elsewhere. Stage boxes also carry
+ * `stage` (for the tap and context-menu handlers) but are never badged.
+ */
+export function failedRunStatus(
+  data: { isGroup?: boolean; stage?: string },
+  failedStageId: string | undefined,
+): "error" | null {
+  if (data.isGroup || !failedStageId) return null;
+  return data.stage === failedStageId ? "error" : null;
+}
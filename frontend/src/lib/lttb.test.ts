@@ -0,0 +1,39 @@
+/**
+ * Unit tests for the LTTB downsampling applied to plotted series.
+ *
+ * Asserts:
+ * - Short or mismatched series are returned as the same arrays.
+ * - Long series shrink to the threshold, keep both endpoints, stay sorted
+ *   in x, and keep an isolated peak that uniform striding would skip.
+ */
+
+import { describe, expect, it } from "vitest";
+import { LTTB_MAX_POINTS, lttb } from "./lttb";
+
+describe("lttb", () => {
+  it("returns short or mismatched series untouched", () => {
+    const x = [0, 1, 2];
+    const y = [3, 4, 5];
+    const out = lttb(x, y);
+    expect(out.x).toBe(x);
+    expect(out.y).toBe(y);
+    const long = Array.from({ length: LTTB_MAX_POINTS + 1 }, (_, i) => i);
+    expect(lttb(long, []).x).toBe(long);
+  });
+
+  it("keeps endpoints and peaks when downsampling", () => {
+    const n = 50_000;
+    const x = Array.from({ length: n }, (_, i) => i * 1e-6);
+    const y = x.map(() => 0.1);
+    y[31_337] = 0.9;
+
+    const out = lttb(x, y, 500);
+    expect(out.x).toHaveLength(500);
+    expect(out.x[0]).toBe(x[0]);
+    expect(out.x.at(-1)).toBe(x[n - 1]);
+    expect(out.y).toContain(0.9);
+    for (let i = 1; i < out.x.length; i++) {
+      expect(out.x[i]).toBeGreaterThan(out.x[i - 1]);
+    }
+  });
+});
@@ -0,0 +1,76 @@
+/** Largest-Triangle-Three-Buckets downsampling for long plotted series. */
+
+/**
+ * Points kept per trace once a series outgrows it. Thermochemical curves
+ * are smooth, so this is visually lossless at plot widths while keeping a
+ * long transient × N species from dominating Plotly's render time.
+ */
+export const LTTB_MAX_POINTS = 2000;
+
+export interface XYSeries {
+  x: number[];
+  y: number[];
+}
+
+/**
+ * Downsample `(x, y)` to at most `threshold` points with LTTB.
+ *
+ * The first and last samples are always kept; each bucket in between keeps
+ * the sample forming the largest triangle with the previously kept point
+ * and the next bucket's average, which preserves peaks (ignition spikes,
+ * intermediate-species maxima) that uniform striding would drop. Series at
+ * or below `threshold`, or with mismatched lengths, are returned as-is --
+ * the very same arrays, so memoized traces stay referentially stable.
+ */
+export function lttb(
+  x: number[],
+  y: number[],
+  threshold: number = LTTB_MAX_POINTS,
+): XYSeries {
+  const n = x.length;
+  if (threshold < 3 || n <= threshold || y.length !== n) return { x, y };
+
+  const outX = new Array<number>(threshold);
+  const outY = new Array<number>(threshold);
+  outX[0] = x[0];
+  outY[0] = y[0];
+
+  const bucketSize = (n - 2) / (threshold - 2);
+  let a = 0;
+  for (let i = 0; i < threshold - 2; i++) {
+    const start = Math.floor(i * bucketSize) + 1;
+    const end = Math.floor((i + 1) * bucketSize) + 1;
+
+    // Average of the next bucket (the last point for the final bucket).
+    const nextStart = end;
+    const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += x[j];
+      avgY += y[j];
+    }
+    const count = nextEnd - nextStart;
+    avgX /= count;
+    avgY /= count;
+
+    const ax = x[a];
+    const ay = y[a];
+    let maxArea = -1;
+    let picked = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs((ax - avgX) * (y[j] - ay) - (ax - x[j]) * (avgY - ay));
+      if (area > maxArea) {
+        maxArea = area;
+        picked = j;
+      }
+    }
+    outX[i + 1] = x[picked];
+    outY[i + 1] = y[picked];
+    a = picked;
+  }
+
+  outX[threshold - 1] = x[n - 1];
+  outY[threshold - 1] = y[n - 1];
+  return { x: outX, y: outY };
+}
@@ -0,0 +1,43 @@
+/**
+ * Unit tests for the default-species ranking used by the results plots.
+ *
+ * Asserts:
+ * - seriesPeak floors at zero and handles series too long to spread.
+ * - rankMainSpecies drops trace species and keeps the largest peaks first.
+ * - Rankings are reused for the same fractions map and recomputed for a new one.
+ */
+
+import { describe, expect, it } from "vitest";
+import { MAIN_SPECIES_MAX_COUNT, rankMainSpecies, seriesPeak } from "./mainSpecies";
+
+describe("mainSpecies", () => {
+  it("seriesPeak floors at zero and scans long series", () => {
+    expect(seriesPeak(undefined)).toBe(0);
+    expect(seriesPeak([-1, -2])).toBe(0);
+    const long = new Array<number>(500_000).fill(0.1);
+    long[123_456] = 0.9;
+    expect(seriesPeak(long)).toBe(0.9);
+  });
+
+  it("rankMainSpecies orders by peak and drops trace species", () => {
+    const X: Record<string, number[]> = {
+      N2: [0.7, 0.71],
+      O2: [0.2, 0.1],
+      OH: [1e-6, 2e-6],
+    };
+    for (let i = 0; i < MAIN_SPECIES_MAX_COUNT; i++) X[`S${i}`] = [0.01];
+
+    const ranked = rankMainSpecies(X);
+    expect(ranked.slice(0, 2)).toEqual(["N2", "O2"]);
+    expect(ranked).toHaveLength(MAIN_SPECIES_MAX_COUNT);
+    expect(ranked).not.toContain("OH");
+  });
+
+  it("rankMainSpecies reuses the ranking of an already-seen fractions map", () => {
+    const X = { N2: [0.7], O2: [0.2] };
+    const first = rankMainSpecies(X);
+    expect(rankMainSpecies(X)).toBe(first);
+    expect(rankMainSpecies({ ...X, O2: [0.9] })).toEqual(["O2", "N2"]);
+    expect(rankMainSpecies(undefined)).toEqual([]);
+  });
+});
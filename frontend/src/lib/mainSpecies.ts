@@ -0,0 +1,52 @@
+/** Pick the species worth plotting by default from a fractions-by-species map. */
+
+/** Species whose peak fraction stays below this are left out of the default plots. */
+export const MAIN_SPECIES_MIN_FRACTION = 1e-4;
+/** At most this many species are plotted by default, largest peak first. */
+export const MAIN_SPECIES_MAX_COUNT = 12;
+
+/**
+ * Largest value of a series, floored at 0.
+ *
+ * A single loop rather than `Math.max(...arr)`: spreading copies the whole
+ * series onto the call stack, which is slow for long transients and throws
+ * a RangeError once the series outgrows the engine's argument limit.
+ */
+export function seriesPeak(values: readonly number[] | undefined): number {
+  let peak = 0;
+  if (!values) return peak;
+  for (let i = 0; i < values.length; i++) {
+    if (values[i] > peak) peak = values[i];
+  }
+  return peak;
+}
+
+/**
+ * Rankings per fractions map. Result series are never mutated once
+ * received, so the map object identifies its contents: switching back to a
+ * reactor, or opening another tab on it, reuses the earlier ranking.
+ */
+const rankingCache = new WeakMap<Record<string, number[]>, readonly string[]>();
+
+/** Names of the species with the largest peak fraction, in descending order. */
+export function rankMainSpecies(
+  fractions: Record<string, number[]> | undefined,
+): readonly string[] {
+  if (!fractions) return [];
+  let ranking = rankingCache.get(fractions);
+  if (!ranking) {
+    ranking = computeRanking(fractions);
+    rankingCache.set(fractions, ranking);
+  }
+  return ranking;
+}
+
+function computeRanking(fractions: Record<string, number[]>): string[] {
+  const ranked: { name: string; peak: number }[] = [];
+  for (const name in fractions) {
+    const peak = seriesPeak(fractions[name]);
+    if (peak >= MAIN_SPECIES_MIN_FRACTION) ranked.push({ name, peak });
+  }
+  ranked.sort((a, b) => b.peak - a.peak);
+  return ranked.slice(0, MAIN_SPECIES_MAX_COUNT).map((s) => s.name);
+}
@@ -1,5 +1,12 @@
 /** Helpers for consistent Plotly axis configuration in result tabs. */
 
+/**
+ * Trace type for time-series lines: WebGL `scattergl` rather than SVG
+ * `scatter`, which slows down past a few thousand points per plot -- a
+ * level long transients × many species reach easily.
+ */
+export const LINE_TRACE_TYPE = "scattergl" as const;
+
 export function coerceNumericSeries(
   values: Array<number | string> | undefined,
 ): number[] {
@@ -3,11 +3,17 @@
  * snapshot, leaving the live graph (`config`) and `dirty` flag untouched —
  * so an out-of-band disk write (e.g. scenario authoring) can refresh what
  * the YAML pane displays without discarding any unsaved node/connection
- * edits sitting in `config`.
+ * edits sitting in `config`. Also asserts the node/connection actions only
+ * copy what they change: removing a node keeps the connections array when
+ * nothing referenced it, and actions on an unknown id are no-ops. Finally,
+ * asserts the id index behind the duplicate checks and `findById` follows
+ * each config version: an id added one edit ago is rejected, and one removed
+ * one edit ago can be reused. `getSoleGroup` / `collectStageGroups` are
+ * checked for the 0, 1 and 2+ stage cases.
  */
 
 import { describe, it, expect, beforeEach } from "vitest";
-import { useConfigStore } from "./configStore";
+import { collectStageGroups, findById, getSoleGroup, useConfigStore } from "./configStore";
 
 describe("configStore", () => {
   beforeEach(() => {
@@ -42,4 +48,67 @@ describe("configStore", () => {
     expect(state.dirty).toBe(false);
     expect(state.config.nodes).toHaveLength(0);
   });
+
+  it("removeNode keeps the connections array when no connection touches the node", () => {
+    const connections = [{ id: "c1", source: "a", target: "b", type: "MassFlowController" }];
+    useConfigStore.setState({
+      config: {
+        nodes: [
+          { id: "a", type: "Reservoir" },
+          { id: "b", type: "Reservoir" },
+          { id: "c", type: "Reservoir" },
+        ],
+        connections,
+      } as never,
+    });
+
+    useConfigStore.getState().removeNode("c");
+    expect(useConfigStore.getState().config.connections).toBe(connections);
+
+    useConfigStore.getState().removeNode("a");
+    const state = useConfigStore.getState();
+    expect(state.config.nodes.map((n) => n.id)).toEqual(["b"]);
+    expect(state.config.connections).toHaveLength(0);
+  });
+
+  it("update/remove actions on an unknown id leave the config untouched", () => {
+    useConfigStore.setState({ dirty: false });
+    const before = useConfigStore.getState().config;
+    const { updateNode, removeNode, updateConnection, removeConnection } =
+      useConfigStore.getState();
+    updateNode("missing", { type: "Reservoir" });
+    removeNode("missing");
+    updateConnection("missing", { type: "Valve" });
+    removeConnection("missing");
+
+    expect(useConfigStore.getState().config).toBe(before);
+    expect(useConfigStore.getState().dirty).toBe(false);
+  });
+
+  it("duplicate-id checks and findById follow each config version", () => {
+    const { addNode, removeNode } = useConfigStore.getState();
+    addNode({ id: "b", type: "Reservoir" } as never);
+    expect(() => addNode({ id: "b", type: "Reservoir" } as never)).toThrow(/already exists/);
+    expect(findById(useConfigStore.getState().config.nodes, "b")?.id).toBe("b");
+
+    removeNode("b");
+    expect(findById(useConfigStore.getState().config.nodes, "b")).toBeUndefined();
+    expect(() => addNode({ id: "b", type: "Reservoir" } as never)).not.toThrow();
+  });
+
+  it("getSoleGroup names the one stage and gives up on a second", () => {
+    const node = (id: string, group?: string) => ({ id, type: "Reservoir", group });
+    const conn = (id: string, group?: string) =>
+      ({ id, type: "Valve", source: "a", target: "b", group });
+
+    expect(getSoleGroup({ nodes: [node("a")], connections: [] } as never)).toBeUndefined();
+    const single = { nodes: [node("a", "s1"), node("b")], connections: [conn("c", "s1")] };
+    expect(getSoleGroup(single as never)).toBe("s1");
+    const two = { nodes: [node("a", "s1")], connections: [conn("c", "s2")] };
+    expect(getSoleGroup(two as never)).toBeUndefined();
+    expect([...collectStageGroups(two.nodes as never, two.connections as never)]).toEqual([
+      "s1",
+      "s2",
+    ]);
+  });
 });
@@ -34,14 +34,62 @@ const EMPTY_CONFIG: NormalizedConfig = {
   connections: [],
 };
 
-/** When every existing node/connection shares the same single stage group, new elements should join it too. */
-function inferSingleGroup(config: NormalizedConfig): string | null | undefined {
-  const groups = new Set(
-    [...config.nodes.map((n) => n.group), ...config.connections.map((c) => c.group)].filter(
-      (g): g is string => typeof g === "string" && g.length > 0,
-    ),
-  );
-  return groups.size === 1 ? [...groups][0] : undefined;
+// id -> position index per nodes/connections array. The store replaces those
+// arrays on every edit, so array identity is the config version: each version
+// is indexed at most once, and repeated lookups against it (duplicate checks
+// on Add, selection lookups on every render) are hash hits instead of scans.
+const idIndexCache = new WeakMap<readonly { id: string }[], Map<string, number>>();
+
+function idIndex(items: readonly { id: string }[]): Map<string, number> {
+  let index = idIndexCache.get(items);
+  if (!index) {
+    index = new Map(items.map((item, i) => [item.id, i]));
+    idIndexCache.set(items, index);
+  }
+  return index;
+}
+
+/** Position of the item with this id, or -1 — an indexed `findIndex`. */
+function indexOfId(items: readonly { id: string }[], id: string): number {
+  return idIndex(items).get(id) ?? -1;
+}
+
+/** The node/connection with this id, looked up through the per-version index. */
+export function findById<T extends { id: string }>(items: readonly T[], id: string): T | undefined {
+  const idx = indexOfId(items, id);
+  return idx === -1 ? undefined : items[idx];
+}
+
+function isStageGroup(g: unknown): g is string {
+  return typeof g === "string" && g.length > 0;
+}
+
+/** Distinct stage groups named by any node or connection, in one pass. */
+export function collectStageGroups(
+  nodes: readonly ConfigNode[],
+  connections: readonly ConfigConnection[],
+): Set<string> {
+  const groups = new Set<string>();
+  for (const n of nodes) if (isStageGroup(n.group)) groups.add(n.group);
+  for (const c of connections) if (isStageGroup(c.group)) groups.add(c.group);
+  return groups;
+}
+
+/**
+ * The config's one stage, when every node/connection that names a stage names
+ * the same one — undefined for 0 or 2+. New elements join that stage too.
+ */
+export function getSoleGroup(config: NormalizedConfig): string | undefined {
+  // Bail out at the second distinct group: past that the answer is already "none".
+  let only: string | undefined;
+  for (const items of [config.nodes, config.connections]) {
+    for (const { group } of items) {
+      if (!isStageGroup(group) || group === only) continue;
+      if (only !== undefined) return undefined;
+      only = group;
+    }
+  }
+  return only;
 }
 
 export const useConfigStore = create<ConfigState>((set, get) => ({
@@ -66,10 +114,10 @@ export const useConfigStore = create<ConfigState>((set, get) => ({
 
   addNode: (node, group) => {
     const { config } = get();
-    if (config.nodes.some((n) => n.id === node.id)) {
+    if (idIndex(config.nodes).has(node.id)) {
       throw new Error(`Node with ID ${node.id} already exists`);
     }
-    const resolvedGroup = group ?? node.group ?? inferSingleGroup(config);
+    const resolvedGroup = group ?? node.group ?? getSoleGroup(config);
     set({
       config: { ...config, nodes: [...config.nodes, { ...node, group: resolvedGroup }] },
       dirty: true,
@@ -78,37 +126,34 @@ export const useConfigStore = create<ConfigState>((set, get) => ({
 
   updateNode: (id, updates) => {
     const { config } = get();
-    set({
-      config: {
-        ...config,
-        nodes: config.nodes.map((n) =>
-          n.id === id ? { ...n, ...updates } : n,
-        ),
-      },
-      dirty: true,
-    });
+    const idx = indexOfId(config.nodes, id);
+    if (idx === -1) return;
+    const nodes = config.nodes.slice();
+    nodes[idx] = { ...nodes[idx], ...updates };
+    set({ config: { ...config, nodes }, dirty: true });
   },
 
   removeNode: (id) => {
     const { config } = get();
-    set({
-      config: {
-        ...config,
-        nodes: config.nodes.filter((n) => n.id !== id),
-        connections: config.connections.filter(
-          (c) => c.source !== id && c.target !== id,
-        ),
-      },
-      dirty: true,
-    });
+    const idx = indexOfId(config.nodes, id);
+    if (idx === -1) return;
+    const nodes = config.nodes.slice();
+    nodes.splice(idx, 1);
+    // Keep the connections array (and its identity, which memoized
+    // consumers key on) when no connection touches the removed node.
+    const touches = (c: ConfigConnection) => c.source === id || c.target === id;
+    const connections = config.connections.some(touches)
+      ? config.connections.filter((c) => !touches(c))
+      : config.connections;
+    set({ config: { ...config, nodes, connections }, dirty: true });
   },
 
   addConnection: (conn, group) => {
     const { config } = get();
-    if (config.connections.some((c) => c.id === conn.id)) {
+    if (idIndex(config.connections).has(conn.id)) {
       throw new Error(`Connection with ID ${conn.id} already exists`);
     }
-    const resolvedGroup = group ?? conn.group ?? inferSingleGroup(config);
+    const resolvedGroup = group ?? conn.group ?? getSoleGroup(config);
     set({
       config: {
         ...config,
@@ -120,26 +165,20 @@ export const useConfigStore = create<ConfigState>((set, get) => ({
 
   updateConnection: (id, updates) => {
     const { config } = get();
-    set({
-      config: {
-        ...config,
-        connections: config.connections.map((c) =>
-          c.id === id ? { ...c, ...updates } : c,
-        ),
-      },
-      dirty: true,
-    });
+    const idx = indexOfId(config.connections, id);
+    if (idx === -1) return;
+    const connections = config.connections.slice();
+    connections[idx] = { ...connections[idx], ...updates };
+    set({ config: { ...config, connections }, dirty: true });
   },
 
   removeConnection: (id) => {
     const { config } = get();
-    set({
-      config: {
-        ...config,
-        connections: config.connections.filter((c) => c.id !== id),
-      },
-      dirty: true,
-    });
+    const idx = indexOfId(config.connections, id);
+    if (idx === -1) return;
+    const connections = config.connections.slice();
+    connections.splice(idx, 1);
+    set({ config: { ...config, connections }, dirty: true });
   },
 
   syncYaml: async () => {
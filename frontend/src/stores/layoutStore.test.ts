@@ -0,0 +1,36 @@
+/**
+ * Asserts layoutStore's width setters clamp and persist, and that a drag
+ * step that leaves the clamped width unchanged is a no-op: no state update
+ * (so no re-render of the shell) and no localStorage write.
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { useLayoutStore } from "./layoutStore";
+
+describe("layoutStore width setters", () => {
+  beforeEach(() => {
+    useLayoutStore.setState({ leftWidth: 320 });
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it("clamps and persists a changed width", () => {
+    useLayoutStore.getState().setLeftWidth(10_000);
+
+    expect(useLayoutStore.getState().leftWidth).toBe(600);
+    expect(JSON.parse(localStorage.getItem("boulder-layout") ?? "{}").leftWidth).toBe(600);
+  });
+
+  it("skips the update and the write when the clamped width is unchanged", () => {
+    useLayoutStore.getState().setLeftWidth(10_000);
+    const before = useLayoutStore.getState();
+    const setItem = vi.spyOn(Storage.prototype, "setItem");
+
+    useLayoutStore.getState().setLeftWidth(20_000);
+
+    expect(useLayoutStore.getState()).toBe(before);
+    expect(setItem).not.toHaveBeenCalled();
+  });
+});
@@ -39,6 +39,11 @@ function clampWidth(w: number, max: number = MAX_WIDTH): number {
   return Math.max(MIN_WIDTH, Math.min(max, Math.round(w)));
 }
 
+/** The width a pane's setter would store for `w` (same min/max clamp). */
+export function clampPaneWidth(side: "left" | "right" | "yaml", w: number): number {
+  return clampWidth(w, side === "yaml" ? YAML_MAX_WIDTH : MAX_WIDTH);
+}
+
 function load(): Partial<LayoutState> {
   if (typeof window === "undefined") return {};
   try {
@@ -48,17 +53,23 @@ function load(): Partial<LayoutState> {
   }
 }
 
+// What this tab last persisted, read once at startup. Width setters fire on
+// every pointermove of a drag, so save() merges into this snapshot instead of
+// re-reading and re-parsing localStorage each time.
+const persisted: Partial<LayoutState> = load();
+
 function save(patch: Partial<LayoutState>): void {
   if (typeof window === "undefined") return;
+  Object.assign(persisted, patch);
   try {
-    localStorage.setItem(STORAGE_KEY, JSON.stringify({ ...load(), ...patch }));
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(persisted));
   } catch {
     /* ignore quota / disabled storage */
   }
 }
 
-export const useLayoutStore = create<LayoutState>((set) => {
-  const init = load();
+export const useLayoutStore = create<LayoutState>((set, get) => {
+  const init = persisted;
   return {
     leftCollapsed: Boolean(init.leftCollapsed),
     rightCollapsed: Boolean(init.rightCollapsed),
@@ -82,11 +93,13 @@ export const useLayoutStore = create<LayoutState>((set) => {
       }),
     setLeftWidth: (w) => {
       const leftWidth = clampWidth(w);
+      if (leftWidth === get().leftWidth) return; // e.g. dragging past the clamp
       save({ leftWidth });
       set({ leftWidth });
     },
     setRightWidth: (w) => {
       const rightWidth = clampWidth(w);
+      if (rightWidth === get().rightWidth) return; // e.g. dragging past the clamp
       save({ rightWidth });
       set({ rightWidth });
     },
@@ -96,6 +109,7 @@ export const useLayoutStore = create<LayoutState>((set) => {
     closeYamlPane: () => set({ yamlPaneOpen: false }),
     setYamlWidth: (w) => {
       const yamlWidth = clampWidth(w, YAML_MAX_WIDTH);
+      if (yamlWidth === get().yamlWidth) return; // e.g. dragging past the clamp
       save({ yamlWidth });
       set({ yamlWidth });
     },
@@ -0,0 +1,48 @@
+/**
+ * Asserts selectionStore skips no-op updates: re-selecting an element with
+ * shallow-equal data (or clearing an empty selection) doesn't notify
+ * subscribers, while a different element or a double-click edit request
+ * still does.
+ */
+
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { useSelectionStore } from "./selectionStore";
+
+describe("selectionStore", () => {
+  beforeEach(() => {
+    useSelectionStore.setState({ selectedElement: null, initialConditionsEditNonce: 0 });
+  });
+
+  it("does not notify subscribers when the same element is selected again", () => {
+    const { setSelectedElement } = useSelectionStore.getState();
+    setSelectedElement({ type: "node", data: { id: "r1", type: "Reservoir" } });
+
+    const listener = vi.fn();
+    const unsubscribe = useSelectionStore.subscribe(listener);
+    setSelectedElement({ type: "node", data: { id: "r1", type: "Reservoir" } });
+    useSelectionStore.setState({}); // sanity: a real set does notify
+    expect(listener).toHaveBeenCalledTimes(1);
+    unsubscribe();
+  });
+
+  it("notifies for a different element and for a double-click edit request", () => {
+    const { setSelectedElement } = useSelectionStore.getState();
+    setSelectedElement({ type: "node", data: { id: "r1" } });
+
+    const listener = vi.fn();
+    const unsubscribe = useSelectionStore.subscribe(listener);
+    setSelectedElement({ type: "node", data: { id: "r2" } });
+    setSelectedElement({ type: "node", data: { id: "r2" } }, { editInitialConditions: true });
+    expect(listener).toHaveBeenCalledTimes(2);
+    expect(useSelectionStore.getState().initialConditionsEditNonce).toBe(1);
+    unsubscribe();
+  });
+
+  it("clearSelection is a no-op when nothing is selected", () => {
+    const listener = vi.fn();
+    const unsubscribe = useSelectionStore.subscribe(listener);
+    useSelectionStore.getState().clearSelection();
+    expect(listener).not.toHaveBeenCalled();
+    unsubscribe();
+  });
+});
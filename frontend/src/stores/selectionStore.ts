@@ -20,15 +20,36 @@ interface SelectionState {
   clearSelection: () => void;
 }
 
+/** Same element type and shallow-equal data (values compared with Object.is). */
+function sameSelection(a: SelectedElement | null, b: SelectedElement | null): boolean {
+  if (a === b) return true;
+  if (!a || !b || a.type !== b.type) return false;
+  if (a.data === b.data) return true;
+  const keys = Object.keys(a.data);
+  if (keys.length !== Object.keys(b.data).length) return false;
+  return keys.every((k) => Object.is(a.data[k], b.data[k]));
+}
+
 export const useSelectionStore = create<SelectionState>((set) => ({
   selectedElement: null,
   initialConditionsEditNonce: 0,
   setSelectedElement: (element, options) =>
-    set((state) => ({
-      selectedElement: element,
-      initialConditionsEditNonce: options?.editInitialConditions
-        ? state.initialConditionsEditNonce + 1
-        : state.initialConditionsEditNonce,
-    })),
-  clearSelection: () => set({ selectedElement: null }),
+    set((state) => {
+      // Re-selecting the element that is already selected (clicking the
+      // same node twice, a graph rebuild re-emitting the selection) keeps
+      // the current state object, so subscribers don't re-render and the
+      // plugin/properties panes don't recompute for nothing. A double-click
+      // still goes through: it bumps the edit nonce.
+      if (!options?.editInitialConditions && sameSelection(state.selectedElement, element)) {
+        return state;
+      }
+      return {
+        selectedElement: element,
+        initialConditionsEditNonce: options?.editInitialConditions
+          ? state.initialConditionsEditNonce + 1
+          : state.initialConditionsEditNonce,
+      };
+    }),
+  clearSelection: () =>
+    set((state) => (state.selectedElement === null ? state : { selectedElement: null })),
 }));
@@ -6,6 +6,11 @@ interface SimulationState {
   simulationId: string | null;
   progress: SimulationProgress | null;
   results: SimulationResults | null;
+  /** Id of the run whose "complete" event delivered `results`, while the
+   * server still holds them; null for results restored from the cache or a
+   * scenario. Lets plugin renders reference the results instead of
+   * re-posting them. */
+  resultsSimulationId: string | null;
   pythonCode: string;
   error: string | null;
 
@@ -14,7 +19,7 @@ interface SimulationState {
   beginSimulationRun: () => void;
   startSimulation: (simulationId: string) => void;
   updateProgress: (progress: SimulationProgress) => void;
-  setResults: (results: SimulationResults) => void;
+  setResults: (results: SimulationResults, simulationId?: string | null) => void;
   setError: (error: string) => void;
   /** The SSE stream's terminal "stopped" event: the solve thread has exited
    * after a stop request, with no completion and no error. */
@@ -28,6 +33,7 @@ export const useSimulationStore = create<SimulationState>((set) => ({
   simulationId: null,
   progress: null,
   results: null,
+  resultsSimulationId: null,
   pythonCode: "",
   error: null,
 
@@ -37,6 +43,7 @@ export const useSimulationStore = create<SimulationState>((set) => ({
       simulationId: null,
       progress: null,
       results: null,
+      resultsSimulationId: null,
       pythonCode: "",
       error: null,
     }),
@@ -47,16 +54,18 @@ export const useSimulationStore = create<SimulationState>((set) => ({
       simulationId,
       progress: null,
       results: null,
+      resultsSimulationId: null,
       pythonCode: "",
       error: null,
     }),
 
   updateProgress: (progress) => set({ progress }),
 
-  setResults: (results) =>
+  setResults: (results, simulationId = null) =>
     set({
       isRunning: false,
       results,
+      resultsSimulationId: simulationId,
       pythonCode: results.code_str ?? "",
     }),
 
@@ -70,6 +79,7 @@ export const useSimulationStore = create<SimulationState>((set) => ({
       simulationId: null,
       progress: null,
       results: null,
+      resultsSimulationId: null,
       pythonCode: "",
       error: null,
     }),
@@ -6,6 +6,8 @@ to validate all API endpoints without starting a real server.
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 httpx = pytest.importorskip("httpx")
@@ -15,6 +17,7 @@ from httpx import ASGITransport, AsyncClient  # noqa: E402
 
 from boulder.api.main import app as module_app  # noqa: E402
 from boulder.api.main import create_app  # noqa: E402
+from boulder.api.memo import DigestLRU  # noqa: E402
 from boulder.api.routes import simulations as simulation_routes  # noqa: E402
 
 # ---------------------------------------------------------------------------
@@ -29,6 +32,52 @@ def _make_client():
     return AsyncClient(transport=transport, base_url="http://test")
 
 
+@pytest.fixture
+def counting(monkeypatch):
+    """Patch ``owner.attr`` with a wrapper recording each call's first argument.
+
+    ``counting(owner, attr)`` wraps the current attribute, or ``impl`` when
+    given, and returns the list the calls are appended to.
+    """
+
+    def install(owner, attr, impl=None):
+        calls: list = []
+        real = impl if impl is not None else getattr(owner, attr)
+
+        def wrapper(arg, *args, **kwargs):
+            calls.append(arg)
+            return real(arg, *args, **kwargs)
+
+        monkeypatch.setattr(owner, attr, wrapper)
+        return calls
+
+    return install
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Replace the ``DigestLRU`` at ``module.name`` with an empty one of the same size."""
+
+    def install(module, name):
+        cache = DigestLRU(maxsize=getattr(module, name).maxsize)
+        monkeypatch.setattr(module, name, cache)
+        return cache
+
+    return install
+
+
+def _register_plugin(monkeypatch, plugin_cls):
+    """Serve ``plugin_cls`` as the only output-pane plugin; return the instance."""
+    from boulder.api.routes import plugins as plugin_routes
+    from boulder.output_pane_plugins import OutputPaneRegistry
+
+    plugin = plugin_cls()
+    registry = OutputPaneRegistry()
+    registry.register(plugin)
+    monkeypatch.setattr(plugin_routes, "get_output_pane_registry", lambda: registry)
+    return plugin
+
+
 # ---------------------------------------------------------------------------
 # Health
 # ---------------------------------------------------------------------------
@@ -184,6 +233,26 @@ class TestConfigRoutes:
             assert "r1" in data["yaml"]
             assert "IdealGasReactor" in data["yaml"]
 
+    @pytest.mark.asyncio
+    async def test_export_config_memoized(self, counting, fresh_cache):
+        """Exporting the same config twice converts it only once.
+
+        Asserts the cached YAML is identical to the first export.
+        """
+        from boulder.api.routes import configs as config_routes
+
+        calls = counting(config_routes, "convert_to_stone_format")
+        fresh_cache(config_routes, "_export_cache")
+        config = {
+            "nodes": [{"id": "r1", "type": "IdealGasReactor", "properties": {}}],
+            "connections": [],
+        }
+        async with _make_client() as client:
+            first = await client.post("/api/configs/export", json={"config": config})
+            second = await client.post("/api/configs/export", json={"config": config})
+        assert first.json() == second.json()
+        assert len(calls) == 1
+
 
 # ---------------------------------------------------------------------------
 # Mechanism routes
@@ -247,6 +316,47 @@ class TestGraphRoutes:
             # 2 nodes + 1 edge = 3 elements
             assert len(elements) == 3
 
+    @pytest.mark.asyncio
+    async def test_get_elements_memoized_by_config(self, counting, fresh_cache):
+        """Re-posting an identical config is served from the digest cache.
+
+        Asserts the converter runs once for two identical posts (key order
+        does not matter) and again for a config that actually changed.
+        """
+        from boulder.api.routes import graph as graph_routes
+
+        calls = counting(graph_routes, "config_to_cyto_elements")
+        fresh_cache(graph_routes, "_elements_cache")
+
+        node = {
+            "id": "r1",
+            "type": "IdealGasReactor",
+            "properties": {"temperature": 1000},
+        }
+        reordered = {
+            "properties": {"temperature": 1000},
+            "type": "IdealGasReactor",
+            "id": "r1",
+        }
+        async with _make_client() as client:
+            first = await client.post(
+                "/api/graph/elements",
+                json={"config": {"nodes": [node], "connections": []}},
+            )
+            second = await client.post(
+                "/api/graph/elements",
+                json={"config": {"connections": [], "nodes": [reordered]}},
+            )
+            assert first.json() == second.json()
+            assert len(calls) == 1
+
+            changed = {**node, "properties": {"temperature": 1200}}
+            await client.post(
+                "/api/graph/elements",
+                json={"config": {"nodes": [changed], "connections": []}},
+            )
+            assert len(calls) == 2
+
     @pytest.mark.asyncio
     async def test_get_stylesheet_light(self):
         async with _make_client() as client:
@@ -286,6 +396,85 @@ class TestPluginRoutes:
             )
             assert resp.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_render_plugin_memoized_by_context(
+        self, monkeypatch, counting, fresh_cache
+    ):
+        """A plugin renders once per distinct context.
+
+        Asserts re-posting an identical context reuses the first result, while
+        a different selection renders again.
+        """
+        from boulder.api.routes import plugins as plugin_routes
+        from boulder.output_pane_plugins import OutputPanePlugin
+
+        class SelectionPlugin(OutputPanePlugin):
+            plugin_id = "counting"
+            tab_label = "Counting"
+
+            def create_content_data(self, context):
+                return {"type": "text", "content": str(context.selected_element)}
+
+        plugin = _register_plugin(monkeypatch, SelectionPlugin)
+        calls = counting(plugin, "create_content_data")
+        fresh_cache(plugin_routes, "_render_cache")
+
+        ctx_a = {"selected_element": {"type": "reactor", "data": {"id": "r1"}}}
+        ctx_b = {"selected_element": {"type": "reactor", "data": {"id": "r2"}}}
+        async with _make_client() as client:
+            first = await client.post("/api/plugins/counting/render", json=ctx_a)
+            await client.post("/api/plugins/counting/render", json=ctx_b)
+            again = await client.post("/api/plugins/counting/render", json=ctx_a)
+        assert first.json() == again.json()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_render_plugin_resolves_simulation_id(
+        self, monkeypatch, counting, fresh_cache
+    ):
+        """Results may be referenced by simulation id instead of re-posted.
+
+        Asserts the plugin receives the server-held results for a known id,
+        a repeated request is served from the render cache without resolving
+        the id again, and an id the server no longer holds answers 404.
+        """
+        from boulder.api.routes import plugins as plugin_routes
+        from boulder.output_pane_plugins import OutputPanePlugin
+
+        class EchoPlugin(OutputPanePlugin):
+            plugin_id = "echo"
+            tab_label = "Echo"
+
+            def create_content_data(self, context):
+                return {"type": "text", "content": "ok"}
+
+        plugin = _register_plugin(monkeypatch, EchoPlugin)
+        seen = counting(plugin, "create_content_data")
+        fresh_cache(plugin_routes, "_render_cache")
+        held = {"times": [0.0, 1.0], "reactors_series": {}}
+        lookups = counting(
+            plugin_routes,
+            "get_completed_simulation_data",
+            lambda sim_id: held if sim_id == "held" else None,
+        )
+
+        async with _make_client() as client:
+            ok = await client.post(
+                "/api/plugins/echo/render", json={"simulation_id": "held"}
+            )
+            again = await client.post(
+                "/api/plugins/echo/render", json={"simulation_id": "held"}
+            )
+            gone = await client.post(
+                "/api/plugins/echo/render", json={"simulation_id": "dropped"}
+            )
+        assert ok.status_code == 200
+        assert again.json() == ok.json()
+        assert [context.simulation_data for context in seen] == [held]
+        # The repeat is a cache hit and never looks the results up again.
+        assert lookups == ["held", "dropped"]
+        assert gone.status_code == 404
+
 
 # ---------------------------------------------------------------------------
 # Simulation routes
@@ -293,6 +482,48 @@ class TestPluginRoutes:
 
 
 class TestSimulationRoutes:
+    @pytest.mark.asyncio
+    async def test_completed_data_matches_complete_event(self):
+        """Plugins get the same results by simulation id as from the browser.
+
+        Asserts the server-held results of a completed run equal the payload
+        of the SSE ``complete`` event the browser receives, timing and stage
+        fields included.
+        """
+        from boulder.api.sse import sanitize_for_json, simulation_event_stream
+        from boulder.simulation_worker import SimulationProgress
+
+        progress = SimulationProgress(
+            times=[0.0, 1.0],
+            reactors_series={"r1": {"T": [300.0, float("nan")]}},
+            is_complete=True,
+            stages_done=1,
+            n_stages=1,
+            completed_stage_ids=["s1"],
+            start_time=10.0,
+            end_time=12.5,
+            total_time=1.0,
+        )
+
+        class DoneWorker:
+            def get_progress(self):
+                return progress
+
+        worker = DoneWorker()
+        simulation_routes._simulations.clear()
+        simulation_routes._simulations["done"] = (worker, 0.0)
+        try:
+            event = await simulation_event_stream(worker).__anext__()
+            held = simulation_routes.get_completed_simulation_data("done")
+        finally:
+            simulation_routes._simulations.clear()
+
+        header, data = event.strip().split("\n", 1)
+        assert header == "event: complete"
+        streamed = json.loads(data[len("data: ") :])
+        assert sanitize_for_json(held) == streamed
+        assert streamed["elapsed_time"] == 2.5
+
     @pytest.mark.asyncio
     async def test_start_simulation_uses_settings_when_fields_omitted(
         self, monkeypatch
@@ -0,0 +1,26 @@
+"""Tests for the digest-keyed memo helpers in :mod:`boulder.api.memo`."""
+
+from __future__ import annotations
+
+from boulder.api.memo import DigestLRU, payload_digest
+
+
+def test_payload_digest_ignores_key_order():
+    """Two dicts with the same items in different order share a digest."""
+    a = {"nodes": [{"id": "r1", "type": "Reservoir"}], "connections": []}
+    b = {"connections": [], "nodes": [{"type": "Reservoir", "id": "r1"}]}
+    assert payload_digest(a) == payload_digest(b)
+    assert payload_digest(a) != payload_digest({**a, "connections": [{"id": "c"}]})
+
+
+def test_digest_lru_evicts_least_recently_used():
+    """Reading an entry refreshes it, so the untouched one is evicted first."""
+    cache: DigestLRU[str] = DigestLRU(maxsize=2)
+    cache.put(b"a", "A")
+    cache.put(b"b", "B")
+    assert cache.get(b"a") == "A"
+    cache.put(b"c", "C")
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "A"
+    assert cache.get(b"c") == "C"
+    assert len(cache) == 2
@@ -45,6 +45,16 @@ def test_flattens_states_and_extras_and_scalars():
     assert series["n"] == 2
 
 
+def test_species_columns_match_the_states_matrix():
+    """Each species list is the matching column of ``states.X``, as Python floats."""
+    states = _states_with_extra()
+    series = _series_from_stage_states(states)
+    assert series is not None
+    j = states.species_names.index("O2")
+    assert series["X"]["O2"] == list(states.X[:, j])
+    assert all(type(v) is float for v in series["Y"]["H2"])
+
+
 def test_single_point_trajectory_is_rejected():
     """A degenerate (< 2 point) trajectory yields None (keeps the snapshot)."""
     gas = ct.Solution("h2o2.yaml")
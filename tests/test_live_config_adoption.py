@@ -116,6 +116,32 @@ class TestAdoptLiveConfigUnit:
         with open(second_path, encoding="utf-8") as f:
             assert f.read() == _SCENARIO_YAML
 
+    def test_filename_cannot_escape_live_config_dir(self, tmp_path):
+        """A client filename with path components is reduced to its basename.
+
+        Asserts the adopted file lands inside the private live-config
+        directory whatever directories the uploaded name carries.
+        """
+        import os
+
+        app = create_app()
+        app.state.preloaded_config_path = None
+
+        class _Req:
+            pass
+
+        req = _Req()
+        req.app = app
+
+        for name in ("../../escape.yaml", str(tmp_path / "abs.yaml"), "..\\win.yaml"):
+            adopt_live_config(
+                req, raw={}, validated={}, yaml_str=_PLAIN_YAML, filename=name
+            )
+            path = app.state.preloaded_config_path
+            assert os.path.dirname(path) == app.state._live_config_dir
+        assert not (tmp_path / "abs.yaml").exists()
+        assert app.state.preloaded_filename == "win.yaml"
+
     def test_noop_when_real_config_path_already_set(self, tmp_path):
         app = create_app()
         real_cfg = tmp_path / "real.yaml"
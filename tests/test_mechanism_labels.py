@@ -0,0 +1,24 @@
+"""Tests for the mechanism dropdown classification in :mod:`boulder.utils`.
+
+Asserts:
+- Non-mechanism data files are excluded case-insensitively.
+- Known mechanisms get their curated label; others get a title-cased label
+  with a fuel hint, "methane" taking priority over the "ethane" it contains.
+"""
+
+from __future__ import annotations
+
+from boulder.utils import _MECHANISM_EXCLUDE_RE, _mechanism_label
+
+
+def test_exclude_pattern_is_case_insensitive():
+    assert _MECHANISM_EXCLUDE_RE.search("Transport_Data.yaml")
+    assert _MECHANISM_EXCLUDE_RE.search("my-thermo.yml")
+    assert not _MECHANISM_EXCLUDE_RE.search("gri30.yaml")
+
+
+def test_mechanism_labels():
+    assert _mechanism_label("gri30.yaml") == "GRI 3.0 (Natural Gas Combustion)"
+    assert _mechanism_label("nDodecane_Reitz.yaml") == "Ndodecane Reitz"
+    assert _mechanism_label("Methane_mech.yml") == "Methane Mech (Methane)"
+    assert _mechanism_label("ethane_hydrogen.yaml") == "Ethane Hydrogen (Hydrogen)"
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import cantera as ct
 import numpy as np
 import pytest
 
+from boulder import payload_store
 from boulder.payload_store import (
+    _loads_payload_json,
     gui_payload_from_solution_array,
     read_payload,
     write_payload,
@@ -118,6 +121,38 @@ def test_raw_tier_non_state(tmp_path: Path):
     assert out["reactors_series"]["r"] == s
 
 
+def test_non_finite_raw_values_round_trip(tmp_path: Path):
+    """NaN/inf in the JSON blob survive the load even though orjson rejects them."""
+    s = {"weird": [1.0, float("nan"), float("inf")]}
+    p = tmp_path / "result.h5"
+    write_payload(p, _payload({"r": s}), MECH)
+    out = read_payload(p)["reactors_series"]["r"]["weird"]
+    assert out[0] == 1.0 and np.isnan(out[1]) and np.isinf(out[2])
+
+
+def test_non_finite_blob_skips_orjson(monkeypatch):
+    """Blobs with NaN/Infinity tokens go straight to the stdlib parser.
+
+    A finite blob is parsed by orjson; a non-finite one never reaches it.
+    """
+    real = payload_store.orjson
+    assert real is not None
+    calls: list = []
+
+    def loads(raw: Any) -> Any:
+        calls.append(raw)
+        return real.loads(raw)
+
+    spy = SimpleNamespace(loads=loads, JSONDecodeError=real.JSONDecodeError)
+    monkeypatch.setattr(payload_store, "orjson", spy)
+
+    assert _loads_payload_json(b'{"a": [1.0]}') == {"a": [1.0]}
+    assert len(calls) == 1
+    out = _loads_payload_json('{"a": [NaN, -Infinity]}')["a"]
+    assert np.isnan(out[0]) and out[1] == float("-inf")
+    assert len(calls) == 1
+
+
 def test_spatial_series_stored_natively(tmp_path: Path):
     """A spatial reactor profile is stored as a native state sequence.
 
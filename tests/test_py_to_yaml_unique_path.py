@@ -0,0 +1,32 @@
+"""Tests for the ``_converted[_N]`` path picker used by the .py upload conversion."""
+
+from __future__ import annotations
+
+import os
+
+from boulder.parser.py_to_yaml import _generate_unique_yaml_path
+
+
+def test_first_conflict_uses_plain_converted_suffix(tmp_path):
+    """With no prior conversions the picker returns ``<stem>_converted.yaml``."""
+    target = tmp_path / "mix.yaml"
+    assert _generate_unique_yaml_path(str(target)) == str(
+        tmp_path / "mix_converted.yaml"
+    )
+
+
+def test_next_suffix_is_one_past_the_largest_existing(tmp_path):
+    """The suffix continues after the largest existing one, even across gaps.
+
+    Also asserts that files for a different stem or extension are ignored.
+    """
+    for name in (
+        "mix_converted.yaml",
+        "mix_converted_4.yaml",
+        "other_converted_9.yaml",
+        "mix_converted_7.yml",
+    ):
+        (tmp_path / name).write_text("")
+    result = _generate_unique_yaml_path(str(tmp_path / "mix.yaml"))
+    assert result == str(tmp_path / "mix_converted_5.yaml")
+    assert not os.path.exists(result)
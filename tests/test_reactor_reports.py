@@ -0,0 +1,38 @@
+"""Reactor and connection reports built from a live Cantera network.
+
+Asserts:
+- A reservoir's report maps every species name to its mole fraction.
+- A mass-flow connection's real volumetric flow uses the upstream density.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import cantera as ct  # type: ignore
+import pytest
+
+from boulder.simulation_worker import (
+    generate_connection_reports,
+    generate_reactor_reports,
+)
+
+
+def test_reservoir_and_connection_reports() -> None:
+    gas = ct.Solution("gri30.yaml")
+    gas.TPX = 300.0, ct.one_atm, "CH4:1, O2:2, N2:7.52"
+    inlet = ct.Reservoir(gas)
+    reactor = ct.IdealGasReactor(gas)
+    mfc = ct.MassFlowController(inlet, reactor, mdot=0.01)
+    converter = SimpleNamespace(
+        reactors={"inlet": inlet, "r": reactor}, connections={"feed": mfc}
+    )
+
+    reports = generate_reactor_reports(converter, {"time": [], "reactors": {}})
+    x = reports["inlet"]["X"]
+    assert list(x) == gas.species_names
+    assert x["O2"] == pytest.approx(gas.X[gas.species_index("O2")])
+
+    conn = generate_connection_reports(converter)["feed"]
+    assert conn["volumetric_flow_real_m3_s"] == pytest.approx(0.01 / gas.density)
+    assert (conn["source_id"], conn["target_id"]) == ("inlet", "r")
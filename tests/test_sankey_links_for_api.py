@@ -5,6 +5,7 @@ Asserts:
 - ``mass`` / ``enthalpy`` / ``heat`` stay semantic for frontend theming.
 - Species keys resolve to colors registered via the plugin slot.
 - When no plugin registers colors, Boulder's light-theme fallback is used.
+- The Sankey theme config is built once per theme and reused.
 """
 
 from boulder.cantera_converter import BoulderPlugins
@@ -73,3 +74,12 @@ def test_sankey_links_for_api_species_use_registered_plugin_colors():
     }
     out = sankey_links_for_api(links, plugins=plugins)
     assert out["color"] == ["#aaaaaa", "#bbbbbb", "#cccccc"]
+
+
+def test_sankey_theme_config_is_cached_per_theme():
+    """Assert repeated lookups share one config per theme string."""
+    from boulder.utils import get_sankey_theme_config
+
+    light = get_sankey_theme_config("light")
+    assert get_sankey_theme_config("light") is light
+    assert get_sankey_theme_config("dark") is not light
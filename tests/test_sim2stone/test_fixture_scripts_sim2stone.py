@@ -406,3 +406,37 @@ def test_boulder_headless_py_yaml_validate_download_run_roundtrip(
     assert run.returncode == 0, (run.stderr or "") + (run.stdout or "")
     out = (run.stdout or "") + (run.stderr or "")
     assert "Simulation completed" in out or "Reactor" in out
+
+
+def test_sim2stone_no_validate_skips_reload(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    """``--no-validate`` writes the YAML without re-loading it for validation.
+
+    Asserts the file is produced, that ``load_config_file`` (the first step
+    of sim2stone's own validation pass) is never reached, and that
+    ``--verbose`` still prints the closing "Done" line.
+    """
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    import boulder.config as boulder_config
+    from boulder.sim2stone_cli import main as sim2stone_main
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("validation pass should have been skipped")
+
+    monkeypatch.setattr(boulder_config, "load_config_file", _fail)
+
+    out_yaml = tmp_path / "reactor2.yaml"
+    rc = sim2stone_main(
+        [
+            str(_EXAMPLES_DIR / "reactor2.py"),
+            "-o",
+            str(out_yaml),
+            "--no-comments",
+            "--no-validate",
+            "--verbose",
+        ]
+    )
+    assert rc == 0
+    assert out_yaml.is_file()
+    assert f"[sim2stone] Done: {out_yaml}" in capsys.readouterr().out
@@ -10,6 +10,10 @@ Asserts:
   The frontend's SSE "complete" handler wrapped that parse in a bare try/catch,
   so the failure was completely silent: the run had finished on the backend,
   but the UI stayed in "Running..." forever with no results and no error shown).
+- _sse_event writes strict JSON (non-finite floats as null) with orjson and
+  with the stdlib fallback.
+- _serialise_reports drops excluded keys (the per-species arrays progress
+  events leave out) and converts array values to lists.
 """
 
 from __future__ import annotations
@@ -17,6 +21,9 @@ from __future__ import annotations
 import json
 import math
 
+import pytest
+
+from boulder.api import sse
 from boulder.api.sse import sanitize_for_json
 
 
@@ -67,3 +74,47 @@ def test_sanitized_payload_survives_strict_json_round_trip():
     # leaked through; re-parsing it here is itself part of the regression check.
     reparsed = json.loads(payload)
     assert reparsed["k"] == [None, None, None, 1.23]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_sse_event_payload_is_strict_json(monkeypatch, use_orjson):
+    """Both encoders emit the same strict JSON for a progress-like payload."""
+    if use_orjson:
+        # A declared dependency: fail, don't skip, when it is missing.
+        assert sse.orjson is not None
+    else:
+        monkeypatch.setattr(sse, "orjson", None)
+
+    class Celsius(float):
+        pass
+
+    event = sse._sse_event(
+        "progress",
+        {"times": [0.0, Celsius(1.5)], "k": [float("nan"), float("-inf")], 3: "x"},
+    )
+    header, data, _ = event.split("\n", 2)
+    assert header == "event: progress"
+    assert json.loads(data[len("data: ") :]) == {
+        "times": [0.0, 1.5],
+        "k": [None, None],
+        "3": "x",
+    }
+
+
+def test_serialise_reports_excludes_final_only_fields():
+    class _Array(list):
+        def tolist(self):
+            return list(self)
+
+    reports = {
+        "r1": {
+            "thermo_report": "text",
+            "X": {"O2": 0.2},
+            "species_names": ["O2"],
+            "molecular_weights": _Array([32.0]),
+            "mass_fractions": _Array([1.0]),
+        }
+    }
+    assert sse._serialise_reports(reports)["r1"]["molecular_weights"] == [32.0]
+    lean = sse._serialise_reports(reports, exclude=sse._FINAL_ONLY_REPORT_FIELDS)
+    assert lean == {"r1": {"thermo_report": "text", "X": {"O2": 0.2}}}
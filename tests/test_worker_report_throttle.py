@@ -0,0 +1,66 @@
+"""Streaming thermo reports are throttled to the SSE poll rate.
+
+Asserts:
+- A burst of progress callbacks regenerates the reactor reports once, not
+  once per integration step; the final reports are still built on completion.
+- The latest streamed reports are published on the progress snapshot.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+from boulder.simulation_worker import SimulationWorker
+
+_CONFIG: Dict[str, Any] = {
+    "metadata": {},
+    "phases": {"gas": {"mechanism": "gri30.yaml"}},
+    "nodes": [{"id": "r", "type": "IdealGasReactor", "properties": {}}],
+    "connections": [],
+}
+
+
+class _Net:
+    pass
+
+
+class _BurstConverter:
+    """Fires many progress callbacks back to back; no Cantera involved."""
+
+    mechanism = "gri30.yaml"
+    reactors: Dict[str, Any] = {}
+
+    def build_network(self, *args: Any, **kwargs: Any) -> _Net:
+        return _Net()
+
+    def run_streaming_simulation(self, progress_callback: Any, **kwargs: Any) -> Any:
+        data = {"time": [0.0], "reactors": {}}
+        for step in range(200):
+            progress_callback(data, float(step), 200.0)
+        return data, "# code"
+
+
+def test_streaming_reports_are_throttled() -> None:
+    worker = SimulationWorker()
+    calls: list[int] = []
+
+    def _reports(converter: Any, results: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(1)
+        return {"r": {"n": len(calls)}}
+
+    with (
+        patch.object(worker, "_persist_to_cache"),
+        patch(
+            "boulder.simulation_worker.generate_reactor_reports", side_effect=_reports
+        ),
+        patch("boulder.simulation_worker.generate_connection_reports", return_value={}),
+        # Imported inside the function, so patch it at its source module.
+        patch("boulder.live_simulation.update_live_simulation"),
+    ):
+        worker._run_simulation(_BurstConverter(), dict(_CONFIG), 1.0, 0.1)
+
+    # One streamed refresh for the whole burst, plus the final reports.
+    assert len(calls) == 2
+    assert worker.progress.reactor_reports == {"r": {"n": 2}}
+    assert worker.progress.is_complete is True